@@ -2,8 +2,10 @@
 
 import argparse
 import csv
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -41,7 +43,7 @@ def cleanup_broken_symlinks():
                 # Method 2: Test if the symlink actually works
                 try:
                     result = subprocess.run([str(esearch_symlink), "-help"], 
-                                          capture_output=True, text=True, timeout=5)
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                     if result.returncode != 0:
                         print("INFO: Detected broken symlinks (execution failed)", file=sys.stderr)
                         should_remove = True
@@ -54,7 +56,7 @@ def cleanup_broken_symlinks():
             # It's a regular file, test if it works
             try:
                 result = subprocess.run([str(esearch_symlink), "-help"], 
-                                      capture_output=True, text=True, timeout=5)
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 if result.returncode != 0:
                     print("INFO: Detected non-working NCBI tools in bin directory", file=sys.stderr)
                     should_remove = True
@@ -125,6 +127,11 @@ def configure_ncbi_tools_path():
     # Verify NCBI tools availability
     return verify_ncbi_tools()
 
+@functools.lru_cache(maxsize=None)
+def _which(tool, path):
+    """shutil.which() memoized per (tool, PATH); avoids spawning `which` for each lookup."""
+    return shutil.which(tool, path=path)
+
 def verify_ncbi_tools():
     """Verify that NCBI tools are available and working."""
     print("INFO: Verifying NCBI E-utilities availability...", file=sys.stderr)
@@ -135,13 +142,12 @@ def verify_ncbi_tools():
     for tool in required_tools:
         try:
             # Try to find the tool
-            result = subprocess.run(["which", tool], capture_output=True, text=True)
-            if result.returncode == 0:
-                tool_path = result.stdout.strip()
+            tool_path = _which(tool, os.environ.get("PATH", ""))
+            if tool_path:
                 print(f"INFO: Found {tool} at: {tool_path}", file=sys.stderr)
                 
                 # Test if the tool actually works
-                test_result = subprocess.run([tool, "-help"], capture_output=True, text=True, timeout=10)
+                test_result = subprocess.run([tool_path, "-help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                 if test_result.returncode == 0:
                     available_tools.append(tool)
                     print(f"INFO: {tool} is working correctly", file=sys.stderr)
@@ -1299,7 +1305,7 @@ def start_streaming_download(keyword: str, file_path: str) -> threading.Thread:
         
         # Double-check tools are still working (they might have been available at startup but failed later)
         try:
-            subprocess.run(["esearch", "-help"], capture_output=True, check=True, text=True, timeout=10)
+            subprocess.run(["esearch", "-help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, timeout=10)
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
             print(f"ERROR: NCBI esearch tool not working: {e}", file=sys.stderr)
             print(f"ERROR: Tools were available at startup but failed during execution", file=sys.stderr)
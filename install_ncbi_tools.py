@@ -194,7 +194,7 @@ def verify_installation():
     for tool in required_tools:
         try:
             # Try to find and test the tool
-            result = subprocess.run([tool, "-help"], capture_output=True, text=True, timeout=10)
+            result = subprocess.run([tool, "-help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
             if result.returncode == 0:
                 print(f"✅ {tool}: Working correctly")
                 working_tools.append(tool)
@@ -223,7 +223,7 @@ def main():
     
     # Check if tools are already installed
     try:
-        subprocess.run(["esearch", "-help"], capture_output=True, check=True, timeout=5)
+        subprocess.run(["esearch", "-help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, timeout=5)
         print("✅ NCBI E-utilities are already installed and working!")
         print("No installation needed.")
         return
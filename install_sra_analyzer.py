@@ -8,21 +8,241 @@ import os
 import sys
 import subprocess
 import platform
-import urllib.request
 import shutil
-import tempfile
+import hashlib
 import json
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-import zipfile
+from string import Template
+
+_SYSTEM = platform.system()
+_SYSTEM_LOWER = _SYSTEM.lower()
+_MACHINE = platform.machine()
+_RELEASE = platform.release()
+
+EDIRECT_INSTALL_URL = "https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh"
+
+# Location of the ollama CLI inside Ollama-darwin.zip
+OLLAMA_ZIP_BINARY = "Ollama.app/Contents/Resources/ollama"
+
+# Contents of the requirements.txt written by create_requirements_file()
+REQUIREMENTS_TXT = b"""# SRA-LLM - Enhanced Requirements
+# ================================
+# This file lists all Python packages required for the enhanced SRA-LLM
+# Install with: pip install -r requirements.txt
+
+# Core dependencies for data processing
+tqdm>=4.64.0              # Progress bars
+requests>=2.31.0          # HTTP requests for GEO data
+pandas>=2.0.0             # Data manipulation and analysis
+numpy>=1.24.0             # Numerical computing
+
+# Visualization dependencies
+matplotlib>=3.7.0         # Plotting and visualization
+wordcloud>=1.9.0          # Word cloud generation
+plotly>=5.17.0            # Interactive plotting
+
+# Web interface dependencies
+streamlit>=1.28.0         # Web app framework
+packaging==24.2           # Specify version to avoid conflicts
+
+# LLM and AI dependencies
+langchain-ollama>=0.1.0   # Ollama integration for LangChain
+
+# Image processing for web interface
+Pillow>=10.0.0            # Image processing
+
+# System utilities
+psutil>=5.9.0             # System and process utilities
+watchdog>=6.0.0           # File monitoring for better Streamlit performance
+"""
+
+# Launcher script templates, filled in by create_launcher_scripts()
+_WIN_LAUNCHER = Template("""@echo off
+echo 🧬 SRA Metadata Analyzer
+echo ========================
+
+cd /d "${install_dir}"
+
+REM Activate virtual environment
+call "${venv_dir}\\Scripts\\activate.bat"
+
+REM Check if analysis script exists
+if not exist "SRA_fetch_1LLM_improved.py" (
+    echo ❌ Main analysis script not found!
+    echo Please ensure SRA_fetch_1LLM_improved.py is in the same directory.
+    pause
+    exit /b 1
+)
+
+REM Run the main analysis script
+echo Starting analysis...
+python SRA_fetch_1LLM_improved.py %*
+
+pause
+""")
+
+_WIN_WEB_LAUNCHER = Template("""@echo off
+echo 🌐 SRA-LLM - Enhanced Web Interface
+echo ==================================
+
+cd /d "${install_dir}"
+
+REM Activate virtual environment
+call "${venv_dir}\\Scripts\\activate.bat"
+
+REM Check if web app script exists
+if not exist "SRA_web_app_enhanced.py" (
+    echo ❌ Enhanced web app script not found!
+    echo Please ensure SRA_web_app_enhanced.py is in the same directory.
+    pause
+    exit /b 1
+)
+
+REM Run the enhanced web interface
+echo Starting enhanced web interface...
+echo Your browser will open automatically at http://localhost:8502
+echo Features: Real-time updates, interactive visualizations, data explorer
+streamlit run SRA_web_app_enhanced.py --server.port 8502
+
+pause
+""")
+
+_UNIX_LAUNCHER = Template("""#!/bin/bash
+echo "🧬 SRA Metadata Analyzer"
+echo "========================"
+
+cd "${install_dir}"
+
+# Configure PATH for NCBI tools (system-wide first, then local fallbacks)
+export PATH="/usr/local/bin:/opt/homebrew/bin:$$HOME/edirect:$$PATH"
+if [ -d "${install_dir}/bin" ]; then
+    export PATH="${install_dir}/bin:$$PATH"
+fi
+if [ -d "${install_dir}/ncbi_tools/edirect" ]; then
+    export PATH="${install_dir}/ncbi_tools/edirect:$$PATH"
+fi
+
+# Verify NCBI tools are available
+if ! command -v esearch >/dev/null 2>&1; then
+    echo "⚠️  WARNING: NCBI E-utilities not found in PATH"
+    echo "Please ensure NCBI E-utilities are installed system-wide or restart terminal"
+    echo "Checked locations:"
+    echo "  - /usr/local/bin (Homebrew Intel)"
+    echo "  - /opt/homebrew/bin (Homebrew Apple Silicon)"
+    echo "  - $$HOME/edirect (Official installation)"
+    echo "  - ${install_dir}/bin (Local symlinks)"
+    echo "  - ${install_dir}/ncbi_tools/edirect (Local installation)"
+fi
+
+# Activate virtual environment
+source "${venv_dir}/bin/activate"
+
+# Check if analysis script exists
+if [ ! -f "SRA_fetch_1LLM_improved.py" ]; then
+    echo "❌ Main analysis script not found!"
+    echo "Please ensure SRA_fetch_1LLM_improved.py is in the same directory."
+    exit 1
+fi
+
+# Run the main analysis script
+echo "Starting analysis..."
+python SRA_fetch_1LLM_improved.py "$$@"
+""")
+
+_UNIX_WEB_LAUNCHER = Template("""#!/bin/bash
+echo "🌐 SRA-LLM - Enhanced Web Interface"
+echo "=================================="
+
+cd "${install_dir}"
+
+# Configure PATH for NCBI tools (system-wide first, then local fallbacks)
+export PATH="/usr/local/bin:/opt/homebrew/bin:$$HOME/edirect:$$PATH"
+if [ -d "${install_dir}/bin" ]; then
+    export PATH="${install_dir}/bin:$$PATH"
+fi
+if [ -d "${install_dir}/ncbi_tools/edirect" ]; then
+    export PATH="${install_dir}/ncbi_tools/edirect:$$PATH"
+fi
+
+# Verify NCBI tools are available
+if ! command -v esearch >/dev/null 2>&1; then
+    echo "⚠️  WARNING: NCBI E-utilities not found in PATH"
+    echo "Please ensure NCBI E-utilities are installed system-wide or restart terminal"
+    echo "Checked locations:"
+    echo "  - /usr/local/bin (Homebrew Intel)"
+    echo "  - /opt/homebrew/bin (Homebrew Apple Silicon)"
+    echo "  - $$HOME/edirect (Official installation)"
+    echo "  - ${install_dir}/bin (Local symlinks)"
+    echo "  - ${install_dir}/ncbi_tools/edirect (Local installation)"
+fi
+
+# Activate virtual environment
+source "${venv_dir}/bin/activate"
+
+# Check if web app script exists
+if [ ! -f "SRA_web_app_enhanced.py" ]; then
+    echo "❌ Enhanced web app script not found!"
+    echo "Please ensure SRA_web_app_enhanced.py is in the same directory."
+    exit 1
+fi
+
+# Run the enhanced web interface
+echo "Starting enhanced web interface..."
+echo "Your browser will open automatically at http://localhost:8502"
+echo "Features: Real-time updates, interactive visualizations, data explorer"
+
+# Try to open browser automatically
+if command -v open >/dev/null 2>&1; then
+    sleep 3 && open http://localhost:8502 &
+elif command -v xdg-open >/dev/null 2>&1; then
+    sleep 3 && xdg-open http://localhost:8502 &
+fi
+
+streamlit run SRA_web_app_enhanced.py --server.port 8502
+""")
+
+def file_sha256(path):
+    """Return the hex SHA-256 digest of a file."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def requirement_name(requirement):
+    """Normalized project name of a requirement specifier (PEP 503)."""
+    name = re.split(r"[\s<>=!~;\[]", requirement.strip(), maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def read_requirements(path):
+    """Return the requirement specifiers in a requirements file, without comments."""
+    requirements = []
+    for line in Path(path).read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            requirements.append(line)
+    return requirements
+
+def bundled_pip_supports_report():
+    """Whether the pip that venv seeds new environments with supports --report."""
+    import ensurepip
+    version = tuple(int(part) for part in ensurepip.version().split(".")[:2])
+    return version >= (22, 2)
 
 class SRAAnalyzerInstaller:
     def __init__(self):
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
+        self.system = _SYSTEM_LOWER
+        self.arch = _MACHINE.lower()
         self.python_min_version = (3, 8)
         self.install_dir = Path.cwd()
         self.venv_dir = self.install_dir / "sra_env"
+        self.install_cache_dir = self.install_dir / ".install_cache"
         
         # Color codes for cross-platform output
         self.colors = {
@@ -35,7 +255,7 @@ class SRAAnalyzerInstaller:
         
         print(f"{self.colors['blue']}🧬 SRA Metadata Analyzer - Comprehensive Installer{self.colors['end']}")
         print("=" * 60)
-        print(f"Detected OS: {platform.system()} {platform.release()}")
+        print(f"Detected OS: {_SYSTEM} {_RELEASE}")
         print(f"Architecture: {self.arch}")
         print()
 
@@ -43,17 +263,68 @@ class SRAAnalyzerInstaller:
         """Print a formatted step message."""
         print(f"{self.colors['blue']}[{step_num}/{total_steps}] {message}{self.colors['end']}")
 
-    def print_success(self, message):
+    def print_success(self, message, file=None):
         """Print a success message."""
-        print(f"{self.colors['green']}✅ {message}{self.colors['end']}")
+        print(f"{self.colors['green']}✅ {message}{self.colors['end']}", file=file)
 
-    def print_error(self, message):
+    def print_error(self, message, file=None):
         """Print an error message."""
-        print(f"{self.colors['red']}❌ {message}{self.colors['end']}")
+        print(f"{self.colors['red']}❌ {message}{self.colors['end']}", file=file)
 
-    def print_warning(self, message):
+    def print_warning(self, message, file=None):
         """Print a warning message."""
-        print(f"{self.colors['yellow']}⚠️ {message}{self.colors['end']}")
+        print(f"{self.colors['yellow']}⚠️ {message}{self.colors['end']}", file=file)
+
+    def _wait_for(self, predicate, *args, timeout=10.0, interval=0.1):
+        """Poll predicate(*args) until it is truthy or timeout seconds pass."""
+        deadline = time.monotonic() + timeout
+        while True:
+            result = predicate(*args)
+            if result or time.monotonic() >= deadline:
+                return result
+            time.sleep(interval)
+
+    def download_file(self, url, dest, versioned=False):
+        """Download url to dest, reusing an intact earlier download of a versioned url."""
+        # The .sha256 record only proves the file is the one downloaded last
+        # time, so it is kept only for URLs that name a fixed release;
+        # "latest"/"current" URLs are fetched again on every run
+        digest_file = dest.with_name(dest.name + ".sha256")
+        if versioned and dest.exists() and digest_file.exists():
+            if file_sha256(dest) == digest_file.read_text().strip():
+                print(f"Using previously downloaded {dest.name}")
+                return dest
+        
+        import urllib.request
+        urllib.request.urlretrieve(url, dest)
+        if versioned:
+            digest_file.write_text(file_sha256(dest))
+        elif digest_file.exists():
+            digest_file.unlink()
+        return dest
+
+    def fetch_text(self, url, timeout=30):
+        """Fetch a small text resource such as an install script."""
+        # curl uses the system certificate store; python.org builds on macOS
+        # have none until "Install Certificates.command" is run, so urllib
+        # is only the fallback
+        if shutil.which("curl"):
+            try:
+                result = subprocess.run(["curl", "-fsSL", "--max-time", str(timeout), url],
+                                        capture_output=True, text=True, check=True)
+                return result.stdout
+            except subprocess.CalledProcessError as e:
+                self.print_warning(f"curl could not fetch {url} ({e}), retrying with urllib...")
+        
+        import urllib.request
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.read().decode("utf-8")
+
+    def remove_download(self, path):
+        """Delete a downloaded file together with its checksum record."""
+        for p in (path, path.with_name(path.name + ".sha256")):
+            if p.exists():
+                p.unlink()
 
     def check_python_installation(self):
         """Check if Python is installed and meets minimum version requirements."""
@@ -75,33 +346,38 @@ class SRAAnalyzerInstaller:
         
         # Download Python installer
         python_version = "3.11.8"
-        if "64" in platform.machine() or "x86_64" in platform.machine():
+        # The default all-users install directory is passed to the installer as
+        # TargetDir so verification can find python.exe there: PrependPath only
+        # updates the registry, not this process's PATH
+        folder = "Python" + "".join(python_version.split(".")[:2])
+        if "64" in _MACHINE:
             python_url = f"https://www.python.org/ftp/python/{python_version}/python-{python_version}-amd64.exe"
+            program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
         else:
             python_url = f"https://www.python.org/ftp/python/{python_version}/python-{python_version}.exe"
+            program_files = os.environ.get("ProgramFiles(x86)") or os.environ.get("ProgramFiles", r"C:\Program Files")
+            folder += "-32"
+        python_exe = Path(program_files) / folder / "python.exe"
         
-        installer_path = Path.cwd() / f"python-{python_version}-installer.exe"
+        installer_path = self.install_dir / f"python-{python_version}-installer.exe"
         
         try:
             print(f"Downloading Python {python_version}...")
-            urllib.request.urlretrieve(python_url, installer_path)
+            self.download_file(python_url, installer_path, versioned=True)
             
-            print("Running Python installer...")
-            print("📋 IMPORTANT: When the installer opens:")
-            print("   ✓ Check 'Add Python to PATH'")
-            print("   ✓ Check 'Install for all users' (if you have admin rights)")
-            print("   ✓ Click 'Install Now'")
+            print("Running Python installer (silent, adds Python to PATH)...")
             
             # Run installer
-            subprocess.run([str(installer_path), "/quiet", "InstallAllUsers=1", "PrependPath=1", "Include_test=0"], check=True)
+            subprocess.run([str(installer_path), "/quiet", "InstallAllUsers=1", "PrependPath=1", "Include_test=0",
+                            f"TargetDir={python_exe.parent}"], check=True)
             
             # Clean up
-            installer_path.unlink()
+            self.remove_download(installer_path)
             self.print_success("Python installed successfully!")
             
             # Verify installation
-            time.sleep(3)
-            result = subprocess.run(["python", "--version"], capture_output=True, text=True)
+            python_cmd = str(python_exe) if self._wait_for(python_exe.exists, timeout=15) else "python"
+            result = subprocess.run([python_cmd, "--version"], capture_output=True, text=True)
             if result.returncode == 0:
                 self.print_success(f"Python verification: {result.stdout.strip()}")
                 return True
@@ -117,14 +393,7 @@ class SRAAnalyzerInstaller:
         """Install Python on macOS."""
         print("\n📥 Installing Python for macOS...")
         
-        # Check if Homebrew is installed
-        try:
-            subprocess.run(["brew", "--version"], capture_output=True, check=True)
-            homebrew_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            homebrew_available = False
-        
-        if homebrew_available:
+        if self._has_brew:
             print("Using Homebrew to install Python...")
             try:
                 subprocess.run(["brew", "install", "python@3.11"], check=True)
@@ -142,17 +411,17 @@ class SRAAnalyzerInstaller:
         else:
             python_url = f"https://www.python.org/ftp/python/{python_version}/python-{python_version}-macosx10.9.pkg"
         
-        installer_path = Path.cwd() / f"python-{python_version}-installer.pkg"
+        installer_path = self.install_dir / f"python-{python_version}-installer.pkg"
         
         try:
             print(f"Downloading Python {python_version}...")
-            urllib.request.urlretrieve(python_url, installer_path)
+            self.download_file(python_url, installer_path, versioned=True)
             
             print("Running Python installer...")
             subprocess.run(["sudo", "installer", "-pkg", str(installer_path), "-target", "/"], check=True)
             
             # Clean up
-            installer_path.unlink()
+            self.remove_download(installer_path)
             self.print_success("Python installed successfully!")
             return True
             
@@ -164,18 +433,42 @@ class SRAAnalyzerInstaller:
         """Create a virtual environment."""
         print(f"\n🔧 Creating virtual environment at {self.venv_dir}...")
         
+        fingerprint = self.venv_fingerprint()
+        if self.get_venv_python().exists() and self.is_step_cached("venv", fingerprint):
+            self.print_success("Virtual environment already set up (cached)")
+            return True
+        
         try:
             if self.venv_dir.exists():
                 print("Removing existing virtual environment...")
                 shutil.rmtree(self.venv_dir)
+            # Anything cached for the old environment is no longer valid
+            shutil.rmtree(self.install_cache_dir, ignore_errors=True)
             
             subprocess.run([sys.executable, "-m", "venv", str(self.venv_dir)], check=True)
+            self.mark_step_done("venv", fingerprint)
             self.print_success("Virtual environment created!")
             return True
         except subprocess.CalledProcessError as e:
             self.print_error(f"Failed to create virtual environment: {e}")
             return False
 
+    def venv_fingerprint(self):
+        """Identify the interpreter the virtual environment is built from."""
+        return hashlib.sha256(f"{sys.executable}|{sys.version}".encode()).hexdigest()
+
+    def is_step_cached(self, step, fingerprint):
+        """Whether an install step already completed with the same fingerprint."""
+        try:
+            return (self.install_cache_dir / f"{step}.sha").read_text().strip() == fingerprint
+        except OSError:
+            return False
+
+    def mark_step_done(self, step, fingerprint):
+        """Record that an install step completed with the given fingerprint."""
+        self.install_cache_dir.mkdir(exist_ok=True)
+        (self.install_cache_dir / f"{step}.sha").write_text(fingerprint)
+
     def get_venv_python(self):
         """Get the Python executable path in the virtual environment."""
         if self.system == "windows":
@@ -190,59 +483,121 @@ class SRAAnalyzerInstaller:
         else:
             return self.venv_dir / "bin" / "pip"
 
-    def install_python_dependencies(self):
-        """Install required Python packages."""
-        print("\n📦 Installing Python dependencies...")
+    def install_python_dependencies(self, log=None):
+        """Install required Python packages, writing all output to log if given."""
+        # pip's own output follows the messages into the log
+        out = {"stdout": log, "stderr": subprocess.STDOUT} if log else {}
+        print("\n📦 Installing Python dependencies...", file=log)
         
-        pip_path = self.get_venv_pip()
+        python_path = self.get_venv_python()
         
-        # Define requirements for enhanced SRA-LLM
-        requirements = [
-            # Core dependencies for data processing
-            "tqdm>=4.64.0",              # Progress bars
-            "requests>=2.31.0",          # HTTP requests for GEO data
-            "pandas>=2.0.0",             # Data manipulation and analysis
-            "numpy>=1.24.0",             # Numerical computing
-            
-            # Visualization dependencies
-            "matplotlib>=3.7.0",         # Plotting and visualization
-            "wordcloud>=1.9.0",          # Word cloud generation
-            "plotly>=5.17.0",            # Interactive plotting
-            
-            # Web interface dependencies
-            "streamlit>=1.28.0",         # Web app framework
-            "packaging==24.2",           # Specify version to avoid conflicts
-            
-            # LLM and AI dependencies
-            "langchain-ollama>=0.1.0",   # Ollama integration for LangChain
-            
-            # Image processing for web interface
-            "Pillow>=10.0.0",            # Image processing
-            
-            # System utilities
-            "psutil>=5.9.0",             # System and process utilities
-            "watchdog>=6.0.0",           # File monitoring for better Streamlit performance
-        ]
+        requirements_file = self.install_dir / "requirements.txt"
+        requirements = read_requirements(requirements_file)
+        lock_file = self.install_dir / "requirements.lock"
         
-        # Upgrade pip first
-        try:
-            subprocess.run([str(pip_path), "install", "--upgrade", "pip"], check=True)
-            self.print_success("Pip upgraded successfully!")
-        except subprocess.CalledProcessError as e:
-            self.print_warning(f"Failed to upgrade pip: {e}")
+        fingerprint = hashlib.sha256(self.venv_fingerprint().encode() + requirements_file.read_bytes()
+                                     + (lock_file.read_bytes() if lock_file.exists() else b"")).hexdigest()
+        if self.is_step_cached("dependencies", fingerprint):
+            self.print_success("Python dependencies already installed (cached)", file=log)
+            return True
+        
+        # Keep downloaded wheels in the project so a reinstall can reuse them
+        env = os.environ.copy()
+        env["PIP_CACHE_DIR"] = str(self.install_dir / ".pip-cache")
         
-        # Install requirements
-        for requirement in requirements:
+        # A hashed lockfile (pip-compile --generate-hashes) pins exact wheels;
+        # it takes precedence over every unpinned install below
+        if lock_file.exists():
             try:
-                print(f"Installing {requirement}...")
-                subprocess.run([str(pip_path), "install", requirement], check=True)
+                print(f"Installing pinned packages from {lock_file.name}...", file=log)
+                subprocess.run([str(python_path), "-m", "pip", "install", "--no-input", "--require-hashes",
+                                "--only-binary=:all:", "-r", str(lock_file)], check=True, env=env, **out)
+                self.mark_step_done("dependencies", fingerprint)
+                self.print_success("All Python dependencies installed!", file=log)
+                return True
             except subprocess.CalledProcessError as e:
-                self.print_error(f"Failed to install {requirement}: {e}")
-                return False
+                self.print_warning(f"Lockfile install failed ({e}), falling back to requirements.txt...", file=log)
+        
+        # uv downloads and installs wheels in parallel; prefer it over plain
+        # pip when present, again from wheels only
+        if shutil.which("uv"):
+            try:
+                print(f"Installing {len(requirements)} packages with uv...", file=log)
+                subprocess.run(["uv", "pip", "install", "--python", str(python_path), "--only-binary", ":all:",
+                                "-r", str(requirements_file)], check=True, env=env, **out)
+                self.mark_step_done("dependencies", fingerprint)
+                self.print_success("All Python dependencies installed!", file=log)
+                return True
+            except subprocess.CalledProcessError as e:
+                self.print_warning(f"uv install failed ({e}), falling back to pip...", file=log)
+        
+        # Upgrade pip and install all requirements in a single pip run, from
+        # wheels only so nothing is compiled from source (wordcloud, psutil...).
+        # pip >= 22.2 can also write a JSON report of what it resolved.
+        report_path = self.install_dir / "pip-install-report.json"
+        cmd = [str(python_path), "-m", "pip", "install", "--only-binary=:all:", "--no-input"]
+        if bundled_pip_supports_report():
+            cmd += ["--report", str(report_path)]
+        if os.environ.get("SRA_PARALLEL_DOWNLOADS"):
+            cmd += ["--find-links", str(self.prefetch_wheels(python_path, requirements, env, log))]
         
-        self.print_success("All Python dependencies installed!")
+        try:
+            print(f"Installing {len(requirements)} packages...", file=log)
+            subprocess.run(cmd + ["--upgrade", "pip", "-r", str(requirements_file)], check=True, env=env, **out)
+            planned = self.read_pip_report(report_path)
+            if planned is not None:
+                print(f"pip installed or upgraded {len(planned)} packages", file=log)
+        except subprocess.CalledProcessError as e:
+            # Only retry requirements pip still had to install; if it never
+            # got as far as writing a report, retry all of them. The retry
+            # allows source builds for packages without a matching wheel.
+            planned = self.read_pip_report(report_path)
+            retry = [r for r in requirements if planned is None or requirement_name(r) in planned]
+            self.print_warning(f"Batch install failed ({e}), retrying {len(retry)} packages one at a time...", file=log)
+            for requirement in retry:
+                try:
+                    print(f"Installing {requirement}...", file=log)
+                    subprocess.run([str(python_path), "-m", "pip", "install", "--prefer-binary", "--no-input", requirement],
+                                   check=True, env=env, **out)
+                except subprocess.CalledProcessError as e:
+                    self.print_error(f"Failed to install {requirement}: {e}", file=log)
+                    return False
+        
+        self.mark_step_done("dependencies", fingerprint)
+        self.print_success("All Python dependencies installed!", file=log)
         return True
 
+    def prefetch_wheels(self, python_path, requirements, env, log=None):
+        """Download wheels for the top-level requirements concurrently into a local wheelhouse."""
+        wheelhouse = self.install_dir / ".wheelhouse"
+        wheelhouse.mkdir(exist_ok=True)
+        
+        def download(requirement):
+            # Wheels only, matching the --only-binary=:all: install that reads
+            # the wheelhouse; an sdist saved here would just be ignored
+            result = subprocess.run([str(python_path), "-m", "pip", "download", "--no-deps", "--only-binary=:all:",
+                                     "--no-input", "--quiet", "-d", str(wheelhouse), requirement], env=env,
+                                    stdout=log, stderr=subprocess.STDOUT if log else None)
+            return result.returncode == 0
+        
+        # --no-deps: dependencies of these packages are not prefetched and are
+        # still downloaded one at a time by the install itself
+        print(f"Prefetching wheels for {len(requirements)} top-level packages in parallel "
+              "(their dependencies are downloaded during the install)...", file=log)
+        with ThreadPoolExecutor(max_workers=min(8, len(requirements))) as executor:
+            downloaded = sum(executor.map(download, requirements))
+        print(f"Prefetched {downloaded}/{len(requirements)} packages into {wheelhouse}", file=log)
+        return wheelhouse
+
+    def read_pip_report(self, report_path):
+        """Return the names pip planned to install from a --report file, or None."""
+        try:
+            report = json.loads(report_path.read_text())
+            report_path.unlink()
+        except (OSError, ValueError):
+            return None
+        return {requirement_name(item["metadata"]["name"]) for item in report.get("install", [])}
+
     def install_ollama(self):
         """Install Ollama."""
         print("\n🤖 Installing Ollama...")
@@ -257,28 +612,30 @@ class SRAAnalyzerInstaller:
 
     def install_ollama_windows(self):
         """Install Ollama on Windows."""
-        try:
-            # Check if Ollama is already installed
-            result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.print_success("Ollama already installed!")
-                return True
-        except FileNotFoundError:
-            pass
+        # Check if Ollama is already installed
+        if shutil.which("ollama"):
+            self.print_success("Ollama already installed!")
+            return True
         
         print("Downloading Ollama for Windows...")
         ollama_url = "https://ollama.com/download/OllamaSetup.exe"
-        installer_path = Path.cwd() / "OllamaSetup.exe"
+        installer_path = self.install_dir / "OllamaSetup.exe"
         
         try:
-            urllib.request.urlretrieve(ollama_url, installer_path)
+            self.download_file(ollama_url, installer_path)
+            
+            print("Running Ollama installer (silent)...")
             
-            print("Running Ollama installer...")
-            print("📋 The Ollama installer will open automatically.")
-            print("   Just follow the installation wizard.")
+            # OllamaSetup.exe is an Inno Setup installer
+            try:
+                subprocess.run([str(installer_path), "/VERYSILENT", "/SUPPRESSMSGBOXES", "/NORESTART"], check=True)
+            finally:
+                self.remove_download(installer_path)
             
-            subprocess.run([str(installer_path)], check=True)
-            installer_path.unlink()
+            # The installer updates the user PATH, which this process does not see
+            default_exe = Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Ollama" / "ollama.exe"
+            if not self._wait_for(lambda: shutil.which("ollama") or default_exe.exists()):
+                self.print_warning("Ollama installer finished but ollama was not found yet - open a new terminal to pick up PATH")
             
             self.print_success("Ollama installation completed!")
             return True
@@ -289,14 +646,10 @@ class SRAAnalyzerInstaller:
 
     def install_ollama_mac(self):
         """Install Ollama on macOS with enhanced Homebrew handling."""
-        try:
-            # Check if Ollama is already installed
-            result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.print_success("Ollama already installed!")
-                return True
-        except FileNotFoundError:
-            pass
+        # Check if Ollama is already installed
+        if shutil.which("ollama"):
+            self.print_success("Ollama already installed!")
+            return True
         
         # Try Homebrew first (if available)
         homebrew_available = self.check_homebrew_availability()
@@ -328,39 +681,33 @@ class SRAAnalyzerInstaller:
         print("Installing Ollama using official installer script...")
         try:
             # Download and run the official Ollama installer
-            subprocess.run([
-                "bash", "-c", 
-                "curl -fsSL https://ollama.com/install.sh | sh"
-            ], check=True)
+            script = self.fetch_text("https://ollama.com/install.sh")
+            subprocess.run(["sh"], input=script, text=True, check=True)
             
             # Verify installation
-            time.sleep(2)
-            try:
-                result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    self.print_success("Ollama installed successfully via official installer!")
-                    return True
-                else:
-                    # Fallback to local installation if system install failed
-                    return self.install_ollama_local()
-            except FileNotFoundError:
-                # Fallback to local installation if not in PATH
-                return self.install_ollama_local()
+            if self._wait_for(shutil.which, "ollama"):
+                self.print_success("Ollama installed successfully via official installer!")
+                return True
+            # Fallback to local installation if not in PATH
+            return self.install_ollama_local()
                 
         except Exception as e:
             self.print_warning(f"Official installer failed: {e}")
             # Final fallback to local installation
             return self.install_ollama_local()
 
+    @cached_property
+    def _has_brew(self):
+        """Whether a brew executable is on PATH (probed once per installer)."""
+        return shutil.which("brew") is not None
+
     def check_homebrew_availability(self):
-        """Check if Homebrew is available and working."""
-        try:
-            result = subprocess.run(["brew", "--version"], capture_output=True, check=True, text=True)
-            print(f"✅ Homebrew found: {result.stdout.split()[1] if result.stdout else 'version unknown'}")
+        """Check if Homebrew is available and report the result."""
+        if self._has_brew:
+            print(f"✅ Homebrew found: {shutil.which('brew')}")
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("❌ Homebrew not found or not working")
-            return False
+        print("❌ Homebrew not found")
+        return False
 
     def install_homebrew(self):
         """Install Homebrew on macOS."""
@@ -377,15 +724,15 @@ class SRAAnalyzerInstaller:
             print("⏳ Running Homebrew installer...")
             result = subprocess.run(install_cmd, check=True, text=True)
             
-            # Verify installation
-            time.sleep(2)
-            
             # Check if brew is now available in common locations
             brew_paths = [
                 "/opt/homebrew/bin/brew",  # Apple Silicon Macs
                 "/usr/local/bin/brew",     # Intel Macs
             ]
             
+            # Verify installation
+            self._wait_for(lambda: any(os.path.exists(p) for p in brew_paths))
+            
             for brew_path in brew_paths:
                 if os.path.exists(brew_path):
                     # Add to current PATH for this session
@@ -398,6 +745,7 @@ class SRAAnalyzerInstaller:
                     try:
                         subprocess.run(["brew", "--version"], check=True, capture_output=True)
                         self.print_success("Homebrew installed and verified!")
+                        self.__dict__.pop("_has_brew", None)  # re-probe with the new PATH
                         
                         # Add to shell profile for permanent access
                         self.add_brew_to_shell_profile(brew_dir)
@@ -418,24 +766,20 @@ class SRAAnalyzerInstaller:
             self.print_error(f"Unexpected error during Homebrew installation: {e}")
             return False
 
+    @cached_property
+    def shell_profile(self):
+        """The user's shell profile: the first existing candidate, else ~/.zshrc."""
+        shell_profiles = [
+            Path.home() / ".zshrc",        # Modern macOS default
+            Path.home() / ".bash_profile", # Older macOS default
+            Path.home() / ".bashrc"        # Alternative
+        ]
+        return next((p for p in shell_profiles if p.exists()), shell_profiles[0])
+
     def add_brew_to_shell_profile(self, brew_dir):
         """Add Homebrew to shell profile for permanent access."""
         try:
-            # Determine the appropriate shell profile file
-            shell_profiles = [
-                Path.home() / ".zshrc",        # Modern macOS default
-                Path.home() / ".bash_profile", # Older macOS default
-                Path.home() / ".bashrc"        # Alternative
-            ]
-            
-            # Use .zshrc as default for modern macOS
-            profile_file = shell_profiles[0]
-            
-            # Check if any profile already exists
-            for profile in shell_profiles:
-                if profile.exists():
-                    profile_file = profile
-                    break
+            profile_file = self.shell_profile
             
             # Add Homebrew to PATH in profile
             brew_export = f'\n# Added by SRA-LLM installer\nexport PATH="{brew_dir}:$PATH"\n'
@@ -456,22 +800,24 @@ class SRAAnalyzerInstaller:
         print("Installing Ollama locally in project directory...")
         ollama_url = "https://ollama.com/download/Ollama-darwin.zip"
         
-        installer_path = Path.cwd() / "Ollama-darwin.zip"
-        local_ollama_dir = Path.cwd() / "ollama_local"
+        installer_path = self.install_dir / "Ollama-darwin.zip"
+        local_ollama_dir = self.install_dir / "ollama_local"
         
         try:
-            urllib.request.urlretrieve(ollama_url, installer_path)
+            self.download_file(ollama_url, installer_path)
             
             # Create local ollama directory
             local_ollama_dir.mkdir(exist_ok=True)
             
-            # Extract to local directory
+            # Extract only the CLI binary and the libraries it loads; the GUI app is not used
+            import zipfile
             with zipfile.ZipFile(installer_path, 'r') as zip_ref:
-                zip_ref.extractall(local_ollama_dir)
+                for name in zip_ref.namelist():
+                    if name == OLLAMA_ZIP_BINARY or name.endswith(".dylib"):
+                        zip_ref.extract(name, local_ollama_dir)
             
             # Create symbolic link to binary for easy access
-            ollama_app_path = local_ollama_dir / "Ollama.app"
-            ollama_binary = ollama_app_path / "Contents" / "Resources" / "ollama"
+            ollama_binary = local_ollama_dir / OLLAMA_ZIP_BINARY
             local_binary_link = local_ollama_dir / "ollama"
             
             if ollama_binary.exists():
@@ -490,7 +836,7 @@ class SRAAnalyzerInstaller:
                 self.print_error("Failed to find Ollama binary in downloaded app")
                 return False
             
-            installer_path.unlink()
+            self.remove_download(installer_path)
             return True
             
         except Exception as e:
@@ -511,25 +857,15 @@ class SRAAnalyzerInstaller:
 
     def install_ncbi_tools_windows(self):
         """Install NCBI E-utilities on Windows using official NCBI method."""
-        try:
-            # Check if already installed system-wide
-            result = subprocess.run(["where", "esearch"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.print_success("NCBI E-utilities already installed system-wide!")
-                return True
-        except Exception:
-            pass
+        # Check if already installed system-wide
+        if shutil.which("esearch"):
+            self.print_success("NCBI E-utilities already installed system-wide!")
+            return True
         
         print("Installing NCBI E-utilities for Windows...")
         
         # Check if we're in a Unix-like environment (Cygwin, WSL, Git Bash)
-        unix_like = False
-        try:
-            # Check if we have bash and curl/wget available
-            subprocess.run(["bash", "--version"], capture_output=True, text=True, check=True)
-            unix_like = True
-        except:
-            pass
+        unix_like = shutil.which("bash") is not None
         
         if unix_like:
             # Use the official installation script (works in Cygwin, WSL, Git Bash)
@@ -574,11 +910,13 @@ class SRAAnalyzerInstaller:
             installer_path = home_edirect / "edirect_pc.exe"
             
             print(f"Downloading installer from {eutils_url}...")
-            urllib.request.urlretrieve(eutils_url, installer_path)
+            self.download_file(eutils_url, installer_path)
             
             # Extract to home directory
-            os.chdir(home_edirect)
-            subprocess.run([str(installer_path)], check=True)
+            try:
+                subprocess.run([str(installer_path)], check=True, cwd=str(home_edirect))
+            finally:
+                self.remove_download(installer_path)
             
             self.print_success("NCBI E-utilities installed to user directory!")
             print(f"✓ Installed to: {home_edirect}")
@@ -606,11 +944,13 @@ class SRAAnalyzerInstaller:
             eutils_url = "https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/versions/current/edirect_pc.exe"
             installer_path = tools_dir / "edirect_pc.exe"
             
-            urllib.request.urlretrieve(eutils_url, installer_path)
+            self.download_file(eutils_url, installer_path)
             
             # Run installer
-            os.chdir(tools_dir)
-            subprocess.run([str(installer_path)], check=True)
+            try:
+                subprocess.run([str(installer_path)], check=True, cwd=str(tools_dir))
+            finally:
+                self.remove_download(installer_path)
             
             self.print_success("NCBI E-utilities installed locally!")
             print(f"✓ Tools available in: {tools_dir / 'edirect'}")
@@ -622,14 +962,10 @@ class SRAAnalyzerInstaller:
 
     def install_ncbi_tools_mac(self):
         """Install NCBI E-utilities on macOS using official NCBI method."""
-        try:
-            # Check if already installed system-wide
-            result = subprocess.run(["which", "esearch"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.print_success("NCBI E-utilities already installed system-wide!")
-                return True
-        except Exception:
-            pass
+        # Check if already installed system-wide
+        if shutil.which("esearch"):
+            self.print_success("NCBI E-utilities already installed system-wide!")
+            return True
         
         print("Installing NCBI E-utilities system-wide for macOS...")
         
@@ -638,10 +974,9 @@ class SRAAnalyzerInstaller:
             print("Installing NCBI E-utilities using official NCBI installer...")
             print("This will install to $HOME/edirect and update your shell profile")
             
-            # Use the official installation command as provided by the user
-            install_cmd = 'sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"'
-            
-            subprocess.run(["bash", "-c", install_cmd], check=True)
+            # Official installation script, run as `sh -c "$(curl ...)"` would
+            script = self.fetch_text(EDIRECT_INSTALL_URL)
+            subprocess.run(["sh", "-c", script], check=True)
             
             # Check if installation worked
             edirect_path = Path.home() / "edirect"
@@ -717,8 +1052,7 @@ class SRAAnalyzerInstaller:
                     
                     # Add PATH export
                     with open(profile, "a") as f:
-                        f.write(f"\n# Added by SRA-LLM installer for NCBI E-utilities\n")
-                        f.write(f"{path_export}\n")
+                        f.write(f"\n# Added by SRA-LLM installer for NCBI E-utilities\n{path_export}\n")
                     
                     print(f"✓ Added PATH to {profile}")
                     
@@ -739,8 +1073,8 @@ class SRAAnalyzerInstaller:
             # Test esearch command
             result = subprocess.run(
                 ["esearch", "-help"], 
-                capture_output=True, 
-                text=True,
+                stdout=subprocess.DEVNULL, 
+                stderr=subprocess.DEVNULL,
                 env=test_env,
                 timeout=10
             )
@@ -759,11 +1093,8 @@ class SRAAnalyzerInstaller:
             tools_dir.mkdir(exist_ok=True)
             
             # Download and install E-utilities locally
-            os.chdir(tools_dir)
-            subprocess.run([
-                "bash", "-c", 
-                "curl -s https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh | bash"
-            ], check=True)
+            script = self.fetch_text(EDIRECT_INSTALL_URL)
+            subprocess.run(["bash"], input=script, text=True, check=True, cwd=str(tools_dir))
             
             # Create symlinks to make tools available
             edirect_dir = tools_dir / "edirect"
@@ -846,15 +1177,13 @@ class SRAAnalyzerInstaller:
     def add_to_path_mac(self, path):
         """Add directory to macOS PATH."""
         try:
-            shell_rc = Path.home() / ".zshrc"
-            if not shell_rc.exists():
-                shell_rc = Path.home() / ".bash_profile"
+            shell_rc = self.shell_profile
             
             with open(shell_rc, "a") as f:
                 f.write(f'\nexport PATH="{path}:$PATH"\n')
             
             print(f"Added {path} to {shell_rc}")
-            print("Please run 'source ~/.zshrc' or restart your terminal")
+            print(f"Please run 'source {shell_rc}' or restart your terminal")
             
         except Exception as e:
             self.print_warning(f"Could not modify PATH automatically: {e}")
@@ -863,170 +1192,23 @@ class SRAAnalyzerInstaller:
         """Create easy-to-use launcher scripts."""
         print("\n🚀 Creating launcher scripts...")
         
-        # Python executable in venv
-        venv_python = self.get_venv_python()
-        
         if self.system == "windows":
-            # Windows batch file
-            launcher_content = f"""@echo off
-echo 🧬 SRA Metadata Analyzer
-echo ========================
-
-cd /d "{self.install_dir}"
-
-REM Activate virtual environment
-call "{self.venv_dir}\\Scripts\\activate.bat"
-
-REM Check if analysis script exists
-if not exist "SRA_fetch_1LLM_improved.py" (
-    echo ❌ Main analysis script not found!
-    echo Please ensure SRA_fetch_1LLM_improved.py is in the same directory.
-    pause
-    exit /b 1
-)
-
-REM Run the main analysis script
-echo Starting analysis...
-python SRA_fetch_1LLM_improved.py %*
-
-pause
-"""
+            launcher_template = _WIN_LAUNCHER
+            web_launcher_template = _WIN_WEB_LAUNCHER
             launcher_path = self.install_dir / "run_sra_analyzer.bat"
-            
-            # Web app launcher
-            web_launcher_content = f"""@echo off
-echo 🌐 SRA-LLM - Enhanced Web Interface
-echo ==================================
-
-cd /d "{self.install_dir}"
-
-REM Activate virtual environment
-call "{self.venv_dir}\\Scripts\\activate.bat"
-
-REM Check if web app script exists
-if not exist "SRA_web_app_enhanced.py" (
-    echo ❌ Enhanced web app script not found!
-    echo Please ensure SRA_web_app_enhanced.py is in the same directory.
-    pause
-    exit /b 1
-)
-
-REM Run the enhanced web interface
-echo Starting enhanced web interface...
-echo Your browser will open automatically at http://localhost:8502
-echo Features: Real-time updates, interactive visualizations, data explorer
-streamlit run SRA_web_app_enhanced.py --server.port 8502
-
-pause
-"""
             web_launcher_path = self.install_dir / "run_web_interface.bat"
-            
         else:  # macOS/Linux
-            # Shell script
-            launcher_content = f"""#!/bin/bash
-echo "🧬 SRA Metadata Analyzer"
-echo "========================"
-
-cd "{self.install_dir}"
-
-# Configure PATH for NCBI tools (system-wide first, then local fallbacks)
-export PATH="/usr/local/bin:/opt/homebrew/bin:$HOME/edirect:$PATH"
-if [ -d "{self.install_dir}/bin" ]; then
-    export PATH="{self.install_dir}/bin:$PATH"
-fi
-if [ -d "{self.install_dir}/ncbi_tools/edirect" ]; then
-    export PATH="{self.install_dir}/ncbi_tools/edirect:$PATH"
-fi
-
-# Verify NCBI tools are available
-if ! command -v esearch >/dev/null 2>&1; then
-    echo "⚠️  WARNING: NCBI E-utilities not found in PATH"
-    echo "Please ensure NCBI E-utilities are installed system-wide or restart terminal"
-    echo "Checked locations:"
-    echo "  - /usr/local/bin (Homebrew Intel)"
-    echo "  - /opt/homebrew/bin (Homebrew Apple Silicon)"
-    echo "  - $HOME/edirect (Official installation)"
-    echo "  - {self.install_dir}/bin (Local symlinks)"
-    echo "  - {self.install_dir}/ncbi_tools/edirect (Local installation)"
-fi
-
-# Activate virtual environment
-source "{self.venv_dir}/bin/activate"
-
-# Check if analysis script exists
-if [ ! -f "SRA_fetch_1LLM_improved.py" ]; then
-    echo "❌ Main analysis script not found!"
-    echo "Please ensure SRA_fetch_1LLM_improved.py is in the same directory."
-    exit 1
-fi
-
-# Run the main analysis script
-echo "Starting analysis..."
-python SRA_fetch_1LLM_improved.py "$@"
-"""
+            launcher_template = _UNIX_LAUNCHER
+            web_launcher_template = _UNIX_WEB_LAUNCHER
             launcher_path = self.install_dir / "run_sra_analyzer.sh"
-            
-            # Web app launcher
-            web_launcher_content = f"""#!/bin/bash
-echo "🌐 SRA-LLM - Enhanced Web Interface"
-echo "=================================="
-
-cd "{self.install_dir}"
-
-# Configure PATH for NCBI tools (system-wide first, then local fallbacks)
-export PATH="/usr/local/bin:/opt/homebrew/bin:$HOME/edirect:$PATH"
-if [ -d "{self.install_dir}/bin" ]; then
-    export PATH="{self.install_dir}/bin:$PATH"
-fi
-if [ -d "{self.install_dir}/ncbi_tools/edirect" ]; then
-    export PATH="{self.install_dir}/ncbi_tools/edirect:$PATH"
-fi
-
-# Verify NCBI tools are available
-if ! command -v esearch >/dev/null 2>&1; then
-    echo "⚠️  WARNING: NCBI E-utilities not found in PATH"
-    echo "Please ensure NCBI E-utilities are installed system-wide or restart terminal"
-    echo "Checked locations:"
-    echo "  - /usr/local/bin (Homebrew Intel)"
-    echo "  - /opt/homebrew/bin (Homebrew Apple Silicon)"
-    echo "  - $HOME/edirect (Official installation)"
-    echo "  - {self.install_dir}/bin (Local symlinks)"
-    echo "  - {self.install_dir}/ncbi_tools/edirect (Local installation)"
-fi
-
-# Activate virtual environment
-source "{self.venv_dir}/bin/activate"
-
-# Check if web app script exists
-if [ ! -f "SRA_web_app_enhanced.py" ]; then
-    echo "❌ Enhanced web app script not found!"
-    echo "Please ensure SRA_web_app_enhanced.py is in the same directory."
-    exit 1
-fi
-
-# Run the enhanced web interface
-echo "Starting enhanced web interface..."
-echo "Your browser will open automatically at http://localhost:8502"
-echo "Features: Real-time updates, interactive visualizations, data explorer"
-
-# Try to open browser automatically
-if command -v open >/dev/null 2>&1; then
-    sleep 3 && open http://localhost:8502 &
-elif command -v xdg-open >/dev/null 2>&1; then
-    sleep 3 && xdg-open http://localhost:8502 &
-fi
-
-streamlit run SRA_web_app_enhanced.py --server.port 8502
-"""
             web_launcher_path = self.install_dir / "run_web_interface.sh"
         
         # Write launcher files
         try:
-            with open(launcher_path, "w") as f:
-                f.write(launcher_content)
-            
-            with open(web_launcher_path, "w") as f:
-                f.write(web_launcher_content)
+            launcher_path.write_text(launcher_template.substitute(
+                install_dir=self.install_dir, venv_dir=self.venv_dir))
+            web_launcher_path.write_text(web_launcher_template.substitute(
+                install_dir=self.install_dir, venv_dir=self.venv_dir))
             
             # Make executable on Unix systems
             if self.system != "windows":
@@ -1044,39 +1226,12 @@ streamlit run SRA_web_app_enhanced.py --server.port 8502
 
     def create_requirements_file(self):
         """Create requirements.txt file."""
-        requirements_content = """# SRA-LLM - Enhanced Requirements
-# ================================
-# This file lists all Python packages required for the enhanced SRA-LLM
-# Install with: pip install -r requirements.txt
-
-# Core dependencies for data processing
-tqdm>=4.64.0              # Progress bars
-requests>=2.31.0          # HTTP requests for GEO data
-pandas>=2.0.0             # Data manipulation and analysis
-numpy>=1.24.0             # Numerical computing
-
-# Visualization dependencies
-matplotlib>=3.7.0         # Plotting and visualization
-wordcloud>=1.9.0          # Word cloud generation
-plotly>=5.17.0            # Interactive plotting
-
-# Web interface dependencies
-streamlit>=1.28.0         # Web app framework
-
-# LLM and AI dependencies
-langchain-ollama>=0.1.0   # Ollama integration for LangChain
-
-# Image processing for web interface
-Pillow>=10.0.0            # Image processing
-
-# System utilities
-psutil>=5.9.0             # System and process utilities
-watchdog>=6.0.0           # File monitoring for better Streamlit performance
-"""
-        
+        target = self.install_dir / "requirements.txt"
         try:
-            with open(self.install_dir / "requirements.txt", "w") as f:
-                f.write(requirements_content)
+            if target.exists() and target.read_bytes() == REQUIREMENTS_TXT:
+                self.print_success("requirements.txt already up to date")
+                return True
+            target.write_bytes(REQUIREMENTS_TXT)
             self.print_success("requirements.txt created")
             return True
         except Exception as e:
@@ -1106,28 +1261,43 @@ watchdog>=6.0.0           # File monitoring for better Streamlit performance
         if not self.create_virtual_environment():
             return False
         
-        # Step 3: Install Python dependencies
-        self.print_step(3, total_steps, "Installing Python dependencies")
-        if not self.install_python_dependencies():
+        # Step 3: Create requirements file (the dependency install reads it)
+        self.print_step(3, total_steps, "Creating requirements file")
+        if not self.create_requirements_file():
             return False
         
-        # Step 4: Install Ollama
-        self.print_step(4, total_steps, "Installing Ollama")
-        if not self.install_ollama():
-            self.print_warning("Ollama installation failed - you can install it manually later")
+        # Step 4 only runs pip, which never prompts, so it proceeds in the
+        # background with its output in a log file rather than on the
+        # terminal. The Ollama and NCBI installers can ask for input
+        # (Homebrew's sudo password, the edirect PATH question) and change
+        # PATH, so steps 5 and 6 stay in sequence on the main thread.
+        self.print_step(4, total_steps, "Installing Python dependencies")
+        pip_log_path = self.install_dir / "pip-install.log"
+        print(f"Installing in the background; pip output goes to {pip_log_path.name}")
+        with open(pip_log_path, "w", buffering=1) as pip_log, ThreadPoolExecutor(max_workers=1) as executor:
+            deps_future = executor.submit(self.install_python_dependencies, pip_log)
+            
+            # Step 5: Install Ollama
+            self.print_step(5, total_steps, "Installing Ollama")
+            if not self.install_ollama():
+                self.print_warning("Ollama installation failed - you can install it manually later")
+            
+            # Step 6: Install NCBI tools
+            self.print_step(6, total_steps, "Installing NCBI E-utilities")
+            ncbi_installed = self.install_ncbi_tools()
         
-        # Step 5: Install NCBI tools
-        self.print_step(5, total_steps, "Installing NCBI E-utilities")
-        if not self.install_ncbi_tools():
+        # Step 4: Python dependencies are required
+        if not deps_future.result():
+            self.print_error(f"Python dependency installation failed - see {pip_log_path}")
+            return False
+        self.print_success(f"Python dependencies installed (details in {pip_log_path.name})")
+        
+        if not ncbi_installed:
             self.print_warning("NCBI tools installation failed - you can install them manually later")
         else:
             # Create symlinks for system-installed tools
             self.create_symlinks_for_ncbi_tools()
         
-        # Step 6: Create requirements file
-        self.print_step(6, total_steps, "Creating requirements file")
-        self.create_requirements_file()
-        
         # Step 7: Create launcher scripts
         self.print_step(7, total_steps, "Creating launcher scripts")
         if not self.create_launcher_scripts():
@@ -8,38 +8,120 @@ Run this script to troubleshoot "esearch not found" errors.
 Usage: python3 ncbi_diagnostic.py
 """
 
+import asyncio
+import functools
+import io
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 
 
+# Looked up once; platform.system() may shell out to uname on some platforms
+_SYSTEM = platform.system()
+_SYSTEM_LOWER = _SYSTEM.lower()
+_MACHINE = platform.machine()
+_RELEASE = platform.release()
+_HOME = Path.home()
+_SCRIPT_DIR = Path(__file__).parent.absolute()
+
+# Common NCBI E-utilities install locations, in the order they are reported
+# (plain strings: they only ever go to os.scandir)
+_LOCATIONS_TO_CHECK = (
+    ("/usr/local/bin", "Homebrew Intel Mac"),
+    ("/opt/homebrew/bin", "Homebrew Apple Silicon Mac"),
+    (os.path.join(_HOME, "edirect"), "Official NCBI installation"),
+    (os.path.join(_SCRIPT_DIR, "bin"), "Project local symlinks"),
+    (os.path.join(_SCRIPT_DIR, "ncbi_tools", "edirect"), "Project local installation"),
+    ("/usr/bin", "System binaries"),
+    (os.path.join(_HOME, ".local", "bin"), "User local binaries"),
+)
+
+# E-utilities reported by check_ncbi_installation_locations()
+_NCBI_TOOLS = frozenset({"esearch", "efetch", "elink", "einfo", "esummary"})
+
+# Case-insensitive match for edirect PATH entries in shell profiles
+_EDIRECT_RE = re.compile(rb"edirect", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _path_entries():
+    """PATH split into entries once, with duplicates removed (first occurrence wins)."""
+    return tuple(dict.fromkeys(os.environ.get("PATH", "").split(os.pathsep)))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_which(tool, path):
+    """shutil.which() memoized per (tool, PATH) so repeated lookups are free."""
+    return shutil.which(tool, path=path)
+
+
+@functools.lru_cache(maxsize=None)
+def _path_exists(path):
+    """Path.exists() memoized for the fixed directories this script probes."""
+    return Path(path).exists()
+
+
+def _entry_kind(entry):
+    """'file', 'broken link' (a symlink whose target is gone) or 'other' for a DirEntry."""
+    if entry.is_file():
+        return "file"
+    if entry.is_symlink() and not entry.is_dir():
+        return "broken link"
+    return "other"
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(path):
+    """Map entry name -> kind for one os.scandir of path, memoized; None if path is missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: _entry_kind(entry) for entry in it}
+    except FileNotFoundError:
+        return None
+    except OSError:
+        return {}
+
+
 def print_header():
     """Print diagnostic header."""
-    print("="*70)
-    print("🔧 NCBI E-UTILITIES DIAGNOSTIC SCRIPT")
-    print("="*70)
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Architecture: {platform.machine()}")
-    print(f"Python: {sys.version}")
-    print("="*70)
-    print()
+    out = [
+        "="*70,
+        "🔧 NCBI E-UTILITIES DIAGNOSTIC SCRIPT",
+        "="*70,
+        f"Platform: {_SYSTEM} {_RELEASE}",
+        f"Architecture: {_MACHINE}",
+        f"Python: {sys.version}",
+        "="*70,
+        "",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def check_current_path():
     """Check current PATH configuration."""
-    print("📍 CURRENT PATH CONFIGURATION")
-    print("-" * 35)
+    out = []
+    out.append("📍 CURRENT PATH CONFIGURATION")
+    out.append("-" * 35)
     
     current_path = os.environ.get("PATH", "")
     if current_path:
-        print("Current PATH entries:")
-        for i, path_entry in enumerate(current_path.split(os.pathsep), 1):
-            print(f"  {i:2d}. {path_entry}")
+        out.append("Current PATH entries:")
+        for i, path_entry in enumerate(_path_entries(), 1):
+            out.append(f"  {i:2d}. {path_entry}")
+        duplicates = current_path.count(os.pathsep) + 1 - len(_path_entries())
+        if duplicates:
+            out.append(f"  ({duplicates} duplicate entries omitted)")
     else:
-        print("❌ No PATH environment variable found!")
-    print()
+        out.append("❌ No PATH environment variable found!")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def check_ncbi_installation_locations():
@@ -47,68 +129,85 @@ def check_ncbi_installation_locations():
     print("📂 CHECKING INSTALLATION LOCATIONS")
     print("-" * 38)
     
-    script_dir = Path(__file__).parent.absolute()
-    home_dir = Path.home()
-    
-    locations_to_check = [
-        ("/usr/local/bin", "Homebrew Intel Mac"),
-        ("/opt/homebrew/bin", "Homebrew Apple Silicon Mac"),
-        (str(home_dir / "edirect"), "Official NCBI installation"),
-        (str(script_dir / "bin"), "Project local symlinks"),
-        (str(script_dir / "ncbi_tools" / "edirect"), "Project local installation"),
-        ("/usr/bin", "System binaries"),
-        (str(home_dir / ".local" / "bin"), "User local binaries"),
-    ]
-    
     found_any = False
-    
-    for location, description in locations_to_check:
-        location_path = Path(location)
-        if location_path.exists():
-            print(f"✅ {description}")
-            print(f"   Path: {location}")
-            
-            # Check for specific NCBI tools
-            ncbi_tools = ["esearch", "efetch", "elink", "einfo", "esummary"]
-            found_tools = []
-            
-            for tool in ncbi_tools:
-                tool_path = location_path / tool
-                if tool_path.exists():
-                    found_tools.append(tool)
-            
-            if found_tools:
-                print(f"   Tools found: {', '.join(found_tools)}")
-                found_any = True
-            else:
-                print(f"   No NCBI tools found in this location")
-            print()
-        else:
+    # Once both tools the pipeline needs have been seen, stop scanning
+    required_remaining = {"esearch", "efetch"}
+    
+    for location, description in _LOCATIONS_TO_CHECK:
+        # One directory read per location instead of a stat per tool; the
+        # listing is shared with search_for_tool()
+        entries = _dir_entries(location)
+        if entries is None:
             print(f"❌ {description}")
             print(f"   Path: {location} (not found)")
             print()
+            continue
+        
+        print(f"✅ {description}")
+        print(f"   Path: {location}")
+        
+        # Check for specific NCBI tools
+        found_tools = sorted(_NCBI_TOOLS & entries.keys())
+        
+        if found_tools:
+            print(f"   Tools found: {', '.join(found_tools)}")
+            found_any = True
+        else:
+            print(f"   No NCBI tools found in this location")
+        print()
+        
+        required_remaining.difference_update(found_tools)
+        if not required_remaining:
+            print("esearch and efetch located; skipping remaining locations")
+            print()
+            break
     
     if not found_any:
         print("⚠️  No NCBI E-utilities found in any standard location!")
         print()
 
 
+async def _run_help(tool, timeout=15):
+    """Run `tool -help` asynchronously; returns/raises like subprocess.run(..., timeout=timeout)."""
+    args = [tool, "-help"]
+    process = await asyncio.create_subprocess_exec(*args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(args, timeout)
+    return subprocess.CompletedProcess(args, process.returncode,
+                                       stdout.decode(errors="replace"), stderr.decode(errors="replace"))
+
+
 def test_ncbi_tools():
     """Test if NCBI tools can be executed with detailed diagnostics."""
-    print("🧪 TESTING NCBI TOOLS EXECUTION")
-    print("-" * 34)
-    
+    return asyncio.run(test_ncbi_tools_async())
+
+
+async def test_ncbi_tools_async(overlap_with=None):
+    """Async test_ncbi_tools; the -help probes run while overlap_with() (if any) runs in a thread."""
     required_tools = ["esearch", "efetch"]
     working_tools = []
     
+    # Start the probes for tools on PATH before doing anything else
+    path = os.pathsep.join(_path_entries())
+    probes = {tool: asyncio.ensure_future(_run_help(tool)) for tool in required_tools if _cached_which(tool, path)}
+    
+    if overlap_with is not None:
+        await asyncio.get_running_loop().run_in_executor(None, overlap_with)
+    
+    print("🧪 TESTING NCBI TOOLS EXECUTION")
+    print("-" * 34)
+    
     for tool in required_tools:
         print(f"Testing {tool}...")
         
         # Try to find the tool
         try:
-            which_result = subprocess.run(["which", tool], capture_output=True, text=True)
-            if which_result.returncode == 0:
-                tool_path = which_result.stdout.strip()
+            tool_path = _cached_which(tool, path)
+            if tool_path:
                 print(f"  ✅ Found at: {tool_path}")
                 
                 # Check file properties
@@ -117,7 +216,7 @@ def test_ncbi_tools():
                 # Test if the tool actually works
                 try:
                     print(f"  🔍 Testing execution of {tool}...")
-                    test_result = subprocess.run([tool, "-help"], capture_output=True, text=True, timeout=15)
+                    test_result = await probes[tool]
                     
                     if test_result.returncode == 0:
                         print(f"  ✅ {tool} is working correctly")
@@ -152,56 +251,85 @@ def test_ncbi_tools():
     
     return working_tools
 
+@functools.lru_cache(maxsize=None)
+def _probe_file(path):
+    """Collect the facts check_file_properties reports, memoized per absolute path."""
+    file_path_obj = Path(path)
+    if not file_path_obj.exists():
+        return {"exists": False}
+    
+    file_stat = file_path_obj.stat()
+    info = {
+        "exists": True,
+        "mode": file_stat.st_mode,
+        "size": file_stat.st_size,
+        "symlink_target": None,
+        "first_bytes": None,
+        "shebang": None,
+        "read_error": None,
+    }
+    
+    if file_path_obj.is_symlink():
+        target = file_path_obj.readlink()
+        info["symlink_target"] = target
+        info["symlink_target_exists"] = target.exists()
+    
+    # Read the start of the file once: magic bytes and the shebang line
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.read(fd, 256)
+        finally:
+            os.close(fd)
+        info["first_bytes"] = head[:20]
+        if head.startswith(b'#!/'):
+            info["shebang"] = head.split(b'\n', 1)[0].decode('utf-8', errors='ignore').strip()
+    except Exception as e:
+        info["read_error"] = e
+    
+    return info
+
 def check_file_properties(file_path):
     """Check detailed properties of a file."""
     try:
-        file_path_obj = Path(file_path)
+        info = _probe_file(os.path.abspath(file_path))
         
         # Check if file exists and is executable
-        if file_path_obj.exists():
+        if info["exists"]:
             print(f"     File exists: ✅")
             
-            # Check permissions
-            import stat
-            file_stat = file_path_obj.stat()
-            mode = file_stat.st_mode
-            
-            if mode & stat.S_IEXEC:
+            # Check permissions; os.access honors group/other bits and ACLs
+            if os.access(file_path, os.X_OK):
                 print(f"     Executable: ✅")
             else:
-                print(f"     Executable: ❌ (permissions: {stat.filemode(mode)})")
+                import stat
+                print(f"     Executable: ❌ (permissions: {stat.filemode(info['mode'])})")
             
             # Check file size
-            size = file_stat.st_size
+            size = info["size"]
             print(f"     File size: {size} bytes")
             if size < 1000:
                 print(f"     ⚠️  File seems very small, might be corrupted or a symlink")
             
             # Check if it's a symlink
-            if file_path_obj.is_symlink():
-                target = file_path_obj.readlink()
-                print(f"     Symlink target: {target}")
-                if not target.exists():
+            if info["symlink_target"] is not None:
+                print(f"     Symlink target: {info['symlink_target']}")
+                if not info["symlink_target_exists"]:
                     print(f"     ❌ Symlink target does not exist!")
             
-            # Try to read first few bytes to check file type
-            try:
-                with open(file_path, 'rb') as f:
-                    first_bytes = f.read(20)
-                    if first_bytes.startswith(b'#!/'):
-                        print(f"     File type: Script (starts with shebang)")
-                        # Read the shebang line
-                        f.seek(0)
-                        shebang = f.readline().decode('utf-8', errors='ignore').strip()
-                        print(f"     Shebang: {shebang}")
-                    elif first_bytes.startswith(b'\x7fELF'):
-                        print(f"     File type: ELF executable")
-                    elif first_bytes.startswith(b'\xcf\xfa\xed\xfe'):
-                        print(f"     File type: Mach-O executable (macOS)")
-                    else:
-                        print(f"     File type: Unknown ({first_bytes[:10].hex()})")
-            except Exception as e:
-                print(f"     Could not read file: {e}")
+            # Report file type from the first few bytes
+            first_bytes = info["first_bytes"]
+            if info["read_error"] is not None:
+                print(f"     Could not read file: {info['read_error']}")
+            elif info["shebang"] is not None:
+                print(f"     File type: Script (starts with shebang)")
+                print(f"     Shebang: {info['shebang']}")
+            elif first_bytes.startswith(b'\x7fELF'):
+                print(f"     File type: ELF executable")
+            elif first_bytes.startswith(b'\xcf\xfa\xed\xfe'):
+                print(f"     File type: Mach-O executable (macOS)")
+            else:
+                print(f"     File type: Unknown ({first_bytes[:10].hex()})")
                 
         else:
             print(f"     File exists: ❌")
@@ -209,6 +337,29 @@ def check_file_properties(file_path):
     except Exception as e:
         print(f"     Error checking file properties: {e}")
 
+# CPU identifiers found in Mach-O and ELF headers
+_MACHO_CPU_TYPES = {0x01000007: "x86_64", 0x0100000C: "arm64", 7: "i386", 12: "arm"}
+_ELF_MACHINES = {0x03: "i386", 0x28: "arm", 0x3E: "x86_64", 0xB7: "aarch64"}
+
+def _describe_architecture(first_bytes):
+    """Describe executable format and CPU from the first 20 header bytes, like `file`."""
+    magic = first_bytes[:4]
+    if magic == b'\xcf\xfa\xed\xfe' and len(first_bytes) >= 8:
+        cpu = int.from_bytes(first_bytes[4:8], "little")
+        return f"Mach-O 64-bit executable {_MACHO_CPU_TYPES.get(cpu, hex(cpu))}"
+    if magic == b'\xca\xfe\xba\xbe' and len(first_bytes) >= 12:
+        count = int.from_bytes(first_bytes[4:8], "big")
+        cpu = int.from_bytes(first_bytes[8:12], "big")
+        return f"Mach-O universal binary with {count} architectures, first {_MACHO_CPU_TYPES.get(cpu, hex(cpu))}"
+    if magic == b'\x7fELF' and len(first_bytes) >= 20:
+        byteorder = "little" if first_bytes[5] == 1 else "big"
+        machine = int.from_bytes(first_bytes[18:20], byteorder)
+        bits = "64-bit" if first_bytes[4] == 2 else "32-bit"
+        return f"ELF {bits} executable {_ELF_MACHINES.get(machine, hex(machine))}"
+    if first_bytes.startswith(b'#!'):
+        return "script"
+    return None
+
 def diagnose_execution_failure(tool_path, test_result):
     """Diagnose why a tool execution failed."""
     print(f"  🔍 Diagnosing execution failure...")
@@ -217,33 +368,50 @@ def diagnose_execution_failure(tool_path, test_result):
     if "library" in test_result.stderr.lower() or "dylib" in test_result.stderr.lower():
         print(f"     Possible missing dependencies detected")
         
-        # Try to check dependencies (macOS)
+        # List linked libraries: in-process with the optional lief package,
+        # otherwise with otool (macOS)
+        libraries = None
         try:
-            otool_result = subprocess.run(["otool", "-L", tool_path], capture_output=True, text=True)
-            if otool_result.returncode == 0:
-                print(f"     Dependencies:")
-                for line in otool_result.stdout.split('\n')[1:6]:  # Show first 5 deps
-                    if line.strip():
-                        print(f"       {line.strip()}")
-        except:
+            import lief
+            binary = lief.parse(tool_path)
+            if binary is not None:
+                libraries = [getattr(lib, "name", lib) for lib in binary.libraries]
+        except ImportError:
             pass
+        except Exception as e:
+            print(f"     Could not read dependencies with lief ({e})")
+        
+        if libraries is None:
+            try:
+                otool_result = subprocess.run(["otool", "-L", tool_path], capture_output=True, text=True)
+                if otool_result.returncode == 0:
+                    libraries = [line.strip() for line in otool_result.stdout.split('\n')[1:] if line.strip()]
+            except OSError:
+                print(f"     Dependency listing skipped (needs the lief package or otool)")
+        
+        if libraries:
+            print(f"     Dependencies:")
+            for library in libraries[:5]:  # Show first 5 deps
+                print(f"       {library}")
     
     # Check if it's a permission issue
     if "permission denied" in test_result.stderr.lower():
         print(f"     Permission issue detected")
         try:
-            subprocess.run(["chmod", "+x", tool_path], check=True)
+            os.chmod(tool_path, os.stat(tool_path).st_mode | 0o111)
+            _probe_file.cache_clear()
             print(f"     Fixed execute permission")
-        except:
+        except OSError:
             print(f"     Could not fix permissions")
     
     # Check if it's an architecture issue
     if "bad cpu type" in test_result.stderr.lower() or "exec format error" in test_result.stderr.lower():
         print(f"     Architecture mismatch detected")
         try:
-            file_result = subprocess.run(["file", tool_path], capture_output=True, text=True)
-            if file_result.returncode == 0:
-                print(f"     File info: {file_result.stdout.strip()}")
+            file_info = _describe_architecture(_probe_file(os.path.abspath(tool_path))["first_bytes"] or b"")
+            if file_info:
+                print(f"     File info: {file_info}")
+                print(f"     This machine: {_MACHINE}")
         except:
             pass
 
@@ -254,25 +422,40 @@ def search_for_tool(tool_name):
     search_paths = [
         "/usr/local/bin",
         "/opt/homebrew/bin",
-        str(Path.home() / "edirect"),
+        str(_HOME / "edirect"),
         "/usr/bin",
-        str(Path.home() / "Downloads"),
+        str(_HOME / "Downloads"),
         ".",
         "./bin",
         "./ncbi_tools/edirect"
     ]
     
+    # NCBI tools live at the top of these directories or in an edirect/ or
+    # bin/ subdirectory, so check those directly instead of walking the tree
+    subdirs = ["", "edirect", "bin"]
+    
     found_locations = []
+    # "." + "bin" is the same directory as "./bin"; check each one once
+    seen_dirs = set()
     
     for search_path in search_paths:
         try:
-            search_path_obj = Path(search_path)
-            if search_path_obj.exists():
+            if _path_exists(search_path):
                 # Look for the tool
-                tool_files = list(search_path_obj.glob(f"**/{tool_name}"))
-                for tool_file in tool_files:
-                    found_locations.append(str(tool_file))
-                    print(f"     Found: {tool_file}")
+                for subdir in subdirs:
+                    tool_file = Path(search_path, subdir, tool_name)
+                    tool_dir = os.path.normpath(tool_file.parent)
+                    if tool_dir in seen_dirs:
+                        continue
+                    seen_dirs.add(tool_dir)
+                    kind = (_dir_entries(str(tool_file.parent)) or {}).get(tool_name)
+                    if kind == "file":
+                        found_locations.append(str(tool_file))
+                        print(f"     Found: {tool_file}")
+                    elif kind == "broken link":
+                        # Installed but unrunnable: the link's target is gone
+                        found_locations.append(str(tool_file))
+                        print(f"     Found: {tool_file} (broken symlink -> {os.readlink(tool_file)})")
         except:
             pass
     
@@ -284,101 +467,122 @@ def search_for_tool(tool_name):
 
 def provide_installation_recommendations():
     """Provide installation recommendations based on platform."""
-    print("💡 INSTALLATION RECOMMENDATIONS")
-    print("-" * 35)
+    out = []
+    out.append("💡 INSTALLATION RECOMMENDATIONS")
+    out.append("-" * 35)
     
-    system = platform.system().lower()
+    system = _SYSTEM_LOWER
     
     if system == "darwin":  # macOS
-        print("For macOS, try these methods in order:")
-        print()
-        print("1. Official NCBI Installation (RECOMMENDED):")
-        print('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
-        print("   This installs to $HOME/edirect")
-        print()
-        print("2. Using Homebrew (if available):")
-        print("   brew install ncbi-edirect")
-        print()
-        print("3. Using the SRA-LLM installer:")
-        print("   python3 install_sra_analyzer.py")
-        print()
+        out.append("For macOS, try these methods in order:")
+        out.append("")
+        out.append("1. Official NCBI Installation (RECOMMENDED):")
+        out.append('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
+        out.append("   This installs to $HOME/edirect")
+        out.append("")
+        out.append("2. Using Homebrew (if available):")
+        out.append("   brew install ncbi-edirect")
+        out.append("")
+        out.append("3. Using the SRA-LLM installer:")
+        out.append("   python3 install_sra_analyzer.py")
+        out.append("")
         
     elif system == "linux":
-        print("For Linux, try these methods:")
-        print()
-        print("1. Official NCBI Installation (RECOMMENDED):")
-        print('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
-        print("   Or with wget:")
-        print('   sh -c "$(wget -q https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh -O -)"')
-        print()
-        print("2. Using the SRA-LLM installer:")
-        print("   python3 install_sra_analyzer.py")
-        print()
+        out.append("For Linux, try these methods:")
+        out.append("")
+        out.append("1. Official NCBI Installation (RECOMMENDED):")
+        out.append('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
+        out.append("   Or with wget:")
+        out.append('   sh -c "$(wget -q https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh -O -)"')
+        out.append("")
+        out.append("2. Using the SRA-LLM installer:")
+        out.append("   python3 install_sra_analyzer.py")
+        out.append("")
         
     elif system == "windows":
-        print("For Windows, try these methods:")
-        print()
-        print("1. Using WSL (Windows Subsystem for Linux):")
-        print('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
-        print()
-        print("2. Using Git Bash or Cygwin:")
-        print('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
-        print()
-        print("3. Using the SRA-LLM installer:")
-        print("   python3 install_sra_analyzer.py")
-        print()
-    
-    print("After installation:")
-    print("• Restart your terminal")
-    print("• Or run: source ~/.bashrc (Linux) or source ~/.zshrc (macOS)")
-    print("• Run this diagnostic script again to verify")
-    print()
+        out.append("For Windows, try these methods:")
+        out.append("")
+        out.append("1. Using WSL (Windows Subsystem for Linux):")
+        out.append('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
+        out.append("")
+        out.append("2. Using Git Bash or Cygwin:")
+        out.append('   sh -c "$(curl -fsSL https://ftp.ncbi.nlm.nih.gov/entrez/entrezdirect/install-edirect.sh)"')
+        out.append("")
+        out.append("3. Using the SRA-LLM installer:")
+        out.append("   python3 install_sra_analyzer.py")
+        out.append("")
+    
+    out.append("After installation:")
+    out.append("• Restart your terminal")
+    out.append("• Or run: source ~/.bashrc (Linux) or source ~/.zshrc (macOS)")
+    out.append("• Run this diagnostic script again to verify")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _edirect_lines(mm):
+    """(line number, text) of the lines mentioning edirect in a mapped profile."""
+    # The compiled bytes regex scans the whole mapping without copying it
+    if not _EDIRECT_RE.search(mm):
+        return []
+    return [(i, line.decode('utf-8', errors='replace').strip())
+            for i, line in enumerate(iter(mm.readline, b""), 1) if _EDIRECT_RE.search(line)]
 
 
 def check_shell_profiles():
     """Check shell profile files for PATH modifications."""
-    print("📝 CHECKING SHELL PROFILES")
-    print("-" * 28)
+    out = []
+    out.append("📝 CHECKING SHELL PROFILES")
+    out.append("-" * 28)
     
-    home_dir = Path.home()
     shell_profiles = [
-        home_dir / ".bashrc",
-        home_dir / ".bash_profile",
-        home_dir / ".zshrc",
-        home_dir / ".profile",
+        _HOME / ".bashrc",
+        _HOME / ".bash_profile",
+        _HOME / ".zshrc",
+        _HOME / ".profile",
     ]
     
     edirect_references = []
     
+    # All profiles live in $HOME: one directory listing instead of a stat each
+    home_entries = _dir_entries(str(_HOME)) or {}
+    
     for profile in shell_profiles:
-        if profile.exists():
+        if profile.name in home_entries:
             try:
-                content = profile.read_text()
-                if "edirect" in content.lower():
-                    print(f"✅ {profile.name}: Contains edirect references")
+                # Scan the mapped file in place; lines are only split out on a hit
+                with open(profile, "rb") as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            lines = _edirect_lines(mm)
+                    else:
+                        lines = []
+                if lines:
+                    out.append(f"✅ {profile.name}: Contains edirect references")
                     # Show relevant lines
-                    lines = content.split('\n')
-                    for i, line in enumerate(lines, 1):
-                        if "edirect" in line.lower():
-                            print(f"   Line {i}: {line.strip()}")
-                            edirect_references.append((profile.name, line.strip()))
+                    for i, line in lines:
+                        out.append(f"   Line {i}: {line}")
+                        edirect_references.append((profile.name, line))
                 else:
-                    print(f"❌ {profile.name}: No edirect references")
+                    out.append(f"❌ {profile.name}: No edirect references")
             except Exception as e:
-                print(f"⚠️  {profile.name}: Error reading file ({e})")
+                out.append(f"⚠️  {profile.name}: Error reading file ({e})")
         else:
-            print(f"❌ {profile.name}: File does not exist")
+            out.append(f"❌ {profile.name}: File does not exist")
     
-    print()
+    out.append("")
     
     if edirect_references:
-        print("Found PATH modifications:")
+        out.append("Found PATH modifications:")
         for profile, line in edirect_references:
-            print(f"  {profile}: {line}")
+            out.append(f"  {profile}: {line}")
     else:
-        print("⚠️  No edirect PATH modifications found in shell profiles")
+        out.append("⚠️  No edirect PATH modifications found in shell profiles")
     
-    print()
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_all_found_tools():
@@ -389,50 +593,88 @@ def test_all_found_tools():
     tools_to_test = ["esearch", "efetch"]
     all_working_tools = []
     
+    found_tools = {}
     for tool in tools_to_test:
         print(f"Searching for all instances of {tool}...")
-        found_tools = search_for_tool(tool)
+        found_tools[tool] = search_for_tool(tool)
+    print()
+    
+    # Start every -help probe at once; results are reported in order below
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        probes = {
+            tool_path: executor.submit(subprocess.run, [tool_path, "-help"], capture_output=True, text=True, timeout=15)
+            for tool in tools_to_test for tool_path in found_tools[tool]
+        }
         
-        if found_tools:
-            for tool_path in found_tools:
-                print(f"\n  Testing: {tool_path}")
-                
-                # Check file properties
-                check_file_properties(tool_path)
-                
-                # Test execution
-                try:
-                    print(f"  🔍 Testing execution...")
-                    test_result = subprocess.run([tool_path, "-help"], capture_output=True, text=True, timeout=15)
+        for tool in tools_to_test:
+            if found_tools[tool]:
+                print(f"Testing instances of {tool}...")
+                for tool_path in found_tools[tool]:
+                    print(f"\n  Testing: {tool_path}")
                     
-                    if test_result.returncode == 0:
-                        print(f"  ✅ This instance of {tool} is working!")
-                        print(f"     Output length: {len(test_result.stdout)} characters")
-                        all_working_tools.append(tool_path)
-                    else:
-                        print(f"  ❌ This instance failed with error code {test_result.returncode}")
-                        if test_result.stderr:
-                            print(f"     STDERR: {test_result.stderr.strip()}")
-                        diagnose_execution_failure(tool_path, test_result)
+                    # Check file properties
+                    check_file_properties(tool_path)
+                    
+                    # Test execution
+                    try:
+                        print(f"  🔍 Testing execution...")
+                        test_result = probes[tool_path].result()
                         
-                except subprocess.TimeoutExpired:
-                    print(f"  ❌ This instance timed out")
-                except Exception as e:
-                    print(f"  ❌ Error testing this instance: {e}")
-        else:
-            print(f"  No instances of {tool} found")
-        
-        print()
+                        if test_result.returncode == 0:
+                            print(f"  ✅ This instance of {tool} is working!")
+                            print(f"     Output length: {len(test_result.stdout)} characters")
+                            all_working_tools.append(tool_path)
+                        else:
+                            print(f"  ❌ This instance failed with error code {test_result.returncode}")
+                            if test_result.stderr:
+                                print(f"     STDERR: {test_result.stderr.strip()}")
+                            diagnose_execution_failure(tool_path, test_result)
+                            
+                    except subprocess.TimeoutExpired:
+                        print(f"  ❌ This instance timed out")
+                    except Exception as e:
+                        print(f"  ❌ Error testing this instance: {e}")
+            else:
+                print(f"  No instances of {tool} found")
+            
+            print()
     
     return all_working_tools
 
 def main():
     """Run complete diagnostic."""
+    # When piped to a file, collect the report in one large buffer instead of
+    # writing it out in many small chunks; a terminal keeps live output
+    if sys.stdout.isatty():
+        return run_diagnostic()
+    
+    # Streams without a binary buffer (StringIO, IDLE, notebooks) are used as-is
+    original_stdout = sys.stdout
+    try:
+        original_stdout.flush()
+        buffered = io.TextIOWrapper(
+            io.BufferedWriter(original_stdout.buffer, buffer_size=1 << 16),
+            encoding=original_stdout.encoding, errors=original_stdout.errors)
+    except (AttributeError, io.UnsupportedOperation, ValueError):
+        return run_diagnostic()
+    
+    sys.stdout = buffered
+    try:
+        return run_diagnostic()
+    finally:
+        sys.stdout = original_stdout
+        # Flush and unwrap without closing the real stdout buffer
+        buffered.detach().detach()
+
+
+def run_diagnostic():
+    """Run every diagnostic step and print the summary."""
     print_header()
     
     check_current_path()
-    check_ncbi_installation_locations()
-    working_tools = test_ncbi_tools()
+    # The location scan runs in a worker thread while the PATH tools' -help
+    # probes are already executing; its output still comes first
+    working_tools = asyncio.run(test_ncbi_tools_async(overlap_with=check_ncbi_installation_locations))
     
     # If PATH tools don't work, test all found instances
     if len(working_tools) < 2:
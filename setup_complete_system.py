@@ -9,44 +9,44 @@ import sys
 from pathlib import Path
 import platform
 
+_SYSTEM = platform.system()
+_SYSTEM_LOWER = _SYSTEM.lower()
+
 def create_sample_keyword_file():
     """Create a sample keyword.csv file if it doesn't exist."""
     keyword_file = Path("keyword.csv")
     
-    if not keyword_file.exists():
-        print("📝 Creating sample keyword.csv file...")
-        
-        sample_keywords = [
-            "SearchTerm",
-            "prostate cancer",
-            "breast cancer", 
-            "BRCA1",
-            "BRCA2",
-            "TP53",
-            "ChIP-seq",
-            "RNA-seq",
-            "single cell",
-            "transcriptome"
-        ]
+    sample_keywords = [
+        "SearchTerm",
+        "prostate cancer",
+        "breast cancer", 
+        "BRCA1",
+        "BRCA2",
+        "TP53",
+        "ChIP-seq",
+        "RNA-seq",
+        "single cell",
+        "transcriptome"
+    ]
+    
+    try:
+        with open(keyword_file, 'x', newline='') as f:
+            print("📝 Creating sample keyword.csv file...")
+            f.write("\n".join(sample_keywords) + "\n")
         
-        try:
-            with open(keyword_file, 'w', newline='') as f:
-                for keyword in sample_keywords:
-                    f.write(f"{keyword}\n")
-            
-            print("✅ Created sample keyword.csv with example research terms")
-            print("   You can edit this file to add your own keywords")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to create keyword.csv: {e}")
-            return False
-    else:
+        print("✅ Created sample keyword.csv with example research terms")
+        print("   You can edit this file to add your own keywords")
+        return True
+    except FileExistsError:
         print("✅ keyword.csv already exists")
         return True
+    except Exception as e:
+        print(f"❌ Failed to create keyword.csv: {e}")
+        return False
 
 def create_launcher_scripts():
     """Create launcher scripts if they don't exist."""
-    system = platform.system().lower()
+    system = _SYSTEM_LOWER
     
     if system == "windows":
         create_windows_launchers()
@@ -58,8 +58,7 @@ def create_windows_launchers():
     
     # Web interface launcher
     web_launcher = Path("run_web_interface.bat")
-    if not web_launcher.exists():
-        web_content = '''@echo off
+    web_content = '''@echo off
 echo 🌐 SRA Metadata Analyzer - Web Interface
 echo =======================================
 
@@ -86,18 +85,20 @@ echo Your browser will open at http://localhost:8501
 streamlit run SRA_web_app_fixed.py
 
 pause'''
-        
-        try:
-            with open(web_launcher, 'w') as f:
-                f.write(web_content)
-            print("✅ Created run_web_interface.bat")
-        except Exception as e:
-            print(f"❌ Failed to create web launcher: {e}")
+    
+    # Exclusive create: an existing launcher is left untouched
+    try:
+        with open(web_launcher, 'x') as f:
+            f.write(web_content)
+        print("✅ Created run_web_interface.bat")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"❌ Failed to create web launcher: {e}")
     
     # Command line launcher
     cli_launcher = Path("run_sra_analyzer.bat")
-    if not cli_launcher.exists():
-        cli_content = '''@echo off
+    cli_content = '''@echo off
 echo 🧬 SRA Metadata Analyzer - Command Line
 echo ====================================
 
@@ -135,21 +136,23 @@ echo.
 python SRA_fetch_1LLM_improved.py --keywords keyword.csv --output result_prompt_fallback.csv
 
 pause'''
-        
-        try:
-            with open(cli_launcher, 'w') as f:
-                f.write(cli_content)
-            print("✅ Created run_sra_analyzer.bat")
-        except Exception as e:
-            print(f"❌ Failed to create CLI launcher: {e}")
+    
+    # Exclusive create: an existing launcher is left untouched
+    try:
+        with open(cli_launcher, 'x') as f:
+            f.write(cli_content)
+        print("✅ Created run_sra_analyzer.bat")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"❌ Failed to create CLI launcher: {e}")
 
 def create_unix_launchers():
     """Create Unix launcher scripts."""
     
     # Web interface launcher
     web_launcher = Path("run_web_interface.sh")
-    if not web_launcher.exists():
-        web_content = '''#!/bin/bash
+    web_content = '''#!/bin/bash
 echo "🌐 SRA Metadata Analyzer - Web Interface"
 echo "======================================="
 
@@ -174,19 +177,21 @@ fi
 echo "Starting web interface..."
 echo "Your browser will open at http://localhost:8501"
 streamlit run SRA_web_app_fixed.py'''
-        
-        try:
-            with open(web_launcher, 'w') as f:
-                f.write(web_content)
-            os.chmod(web_launcher, 0o755)
-            print("✅ Created run_web_interface.sh")
-        except Exception as e:
-            print(f"❌ Failed to create web launcher: {e}")
+    
+    # Exclusive create: an existing launcher is left untouched
+    try:
+        with open(web_launcher, 'x') as f:
+            f.write(web_content)
+        os.chmod(web_launcher, 0o755)
+        print("✅ Created run_web_interface.sh")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"❌ Failed to create web launcher: {e}")
     
     # Command line launcher
     cli_launcher = Path("run_sra_analyzer.sh")
-    if not cli_launcher.exists():
-        cli_content = '''#!/bin/bash
+    cli_content = '''#!/bin/bash
 echo "🧬 SRA Metadata Analyzer - Command Line"
 echo "===================================="
 
@@ -222,14 +227,17 @@ echo "  Basic: python SRA_fetch_1LLM_improved.py --keywords keyword.csv --output
 echo "  Custom model: python SRA_fetch_1LLM_improved.py --keywords keyword.csv --output results.csv --model llama3.1:8b"
 echo
 python SRA_fetch_1LLM_improved.py --keywords keyword.csv --output result_prompt_fallback.csv'''
-        
-        try:
-            with open(cli_launcher, 'w') as f:
-                f.write(cli_content)
-            os.chmod(cli_launcher, 0o755)
-            print("✅ Created run_sra_analyzer.sh")
-        except Exception as e:
-            print(f"❌ Failed to create CLI launcher: {e}")
+    
+    # Exclusive create: an existing launcher is left untouched
+    try:
+        with open(cli_launcher, 'x') as f:
+            f.write(cli_content)
+        os.chmod(cli_launcher, 0o755)
+        print("✅ Created run_sra_analyzer.sh")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"❌ Failed to create CLI launcher: {e}")
 
 def check_required_files():
     """Check if all required files are present."""
@@ -259,11 +267,10 @@ def create_startup_guide():
     """Create a simple startup guide."""
     guide_file = Path("START_HERE.txt")
     
-    if not guide_file.exists():
-        system = platform.system().lower()
-        
-        if system == "windows":
-            guide_content = """🧬 SRA Metadata Analyzer - Quick Start Guide
+    system = _SYSTEM_LOWER
+    
+    if system == "windows":
+        guide_content = """🧬 SRA Metadata Analyzer - Quick Start Guide
 
 STEP 1: INSTALL EVERYTHING
 Double-click: install_windows.bat
@@ -291,8 +298,8 @@ SUPPORT:
 - Ensure all files are in the same folder
 
 Happy analyzing! 🚀"""
-        else:
-            guide_content = """🧬 SRA Metadata Analyzer - Quick Start Guide
+    else:
+        guide_content = """🧬 SRA Metadata Analyzer - Quick Start Guide
 
 STEP 1: INSTALL EVERYTHING
 Double-click: install_mac.sh
@@ -320,13 +327,15 @@ SUPPORT:
 - Ensure all files are in the same folder
 
 Happy analyzing! 🚀"""
-        
-        try:
-            with open(guide_file, 'w') as f:
-                f.write(guide_content)
-            print("✅ Created START_HERE.txt with quick start guide")
-        except Exception as e:
-            print(f"❌ Failed to create startup guide: {e}")
+    
+    try:
+        with open(guide_file, 'x') as f:
+            f.write(guide_content)
+        print("✅ Created START_HERE.txt with quick start guide")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"❌ Failed to create startup guide: {e}")
 
 def main():
     """Main setup function."""
@@ -357,7 +366,7 @@ def main():
     print("\n📋 Next steps:")
     print("1. Run the installer:")
     
-    system = platform.system().lower()
+    system = _SYSTEM_LOWER
     if system == "windows":
         print("   • Double-click: install_windows.bat")
         print("2. After installation, start the web interface:")
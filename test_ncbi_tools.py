@@ -5,44 +5,100 @@ Simple NCBI Tools Test Script
 This script tests NCBI tools execution and provides detailed error information.
 Use this on the computer having issues to get specific error details.
 
-Usage: python3 test_ncbi_tools.py
+Usage: python3 test_ncbi_tools.py [--verbose]
 """
 
+import argparse
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import stat
 
 
-def test_specific_tool(tool_path):
-    """Test a specific tool path with detailed diagnostics."""
+_HOME = Path.home()
+
+# Package-manager bin directories: tools sit at the top level, never deeper
+_FLAT_DIRS = {"/usr/local/bin", "/opt/homebrew/bin", "/usr/bin"}
+
+# File types of native executables, keyed by their first four bytes
+_MAGICS = {
+    b'\x7fELF': "ELF executable (Linux)",
+    b'\xcf\xfa\xed\xfe': "Mach-O executable (macOS)",
+    b'\xca\xfe\xba\xbe': "Mach-O executable (macOS)",
+}
+
+
+def _run_help(tool_path):
+    """Run `tool_path -help` with the tool's directory first on PATH, as test_specific_tool reports it."""
+    # Sibling EDirect helpers (xtract, nquire...) are found through PATH, so
+    # there is no need to chdir into the tool's directory
+    env = dict(os.environ, PATH=os.pathsep.join([str(Path(tool_path).parent), os.environ.get("PATH", "")]))
+    return subprocess.run(
+        [str(tool_path), "-help"], 
+        capture_output=True, 
+        text=True, 
+        timeout=30,
+        env=env
+    )
+
+
+def test_specific_tool(tool_path, probe=None, verbose=False):
+    """Test a specific tool path with detailed diagnostics.
+    
+    probe is an optional future already running _run_help(tool_path);
+    verbose also prints the file's permission string.
+    """
     print(f"\n{'='*60}")
     print(f"TESTING: {tool_path}")
     print(f"{'='*60}")
     
     tool_path_obj = Path(tool_path)
     
-    # 1. Check if file exists
-    if not tool_path_obj.exists():
-        print(f"❌ File does not exist: {tool_path}")
-        return False
+    # 1. Open the file once; the descriptor answers the stat and read checks
+    read_error = None
+    file_stat = None
+    opened = False
+    try:
+        fd = os.open(tool_path, os.O_RDONLY)
+    except OSError as e:
+        read_error = e
+    else:
+        opened = True
+        try:
+            file_stat = os.fstat(fd)
+            first_bytes = os.read(fd, 512)
+        except OSError as e:
+            read_error = e
+        finally:
+            os.close(fd)
     
-    print(f"✅ File exists")
+    # Unreadable but present files (or a failed fstat) still get their
+    # permissions reported from a plain stat
+    if file_stat is None:
+        try:
+            file_stat = os.stat(tool_path)
+        except OSError as e:
+            if opened:
+                print(f"❌ Could not check file: {e}")
+            else:
+                print(f"❌ File does not exist: {tool_path}")
+            return False
     
-    # 2. Check permissions
-    file_stat = tool_path_obj.stat()
-    mode = file_stat.st_mode
+    print(f"✅ File exists")
     
-    print(f"📋 File permissions: {stat.filemode(mode)}")
+    # 2. Check permissions; os.access honors group/other bits and ACLs
+    if verbose:
+        print(f"📋 File permissions: {stat.filemode(file_stat.st_mode)}")
     
-    if mode & stat.S_IEXEC:
+    if os.access(tool_path, os.X_OK):
         print(f"✅ File is executable")
     else:
         print(f"❌ File is NOT executable")
         print(f"🔧 Trying to fix permissions...")
         try:
-            os.chmod(tool_path, mode | stat.S_IEXEC)
+            os.chmod(tool_path, file_stat.st_mode | 0o111)
             print(f"✅ Fixed permissions")
         except Exception as e:
             print(f"❌ Could not fix permissions: {e}")
@@ -56,38 +112,31 @@ def test_specific_tool(tool_path):
         print(f"⚠️  File seems very small - might be corrupted")
     
     # 4. Check file type
-    try:
-        with open(tool_path, 'rb') as f:
-            first_bytes = f.read(50)
-            
-        if first_bytes.startswith(b'#!/'):
-            print(f"📄 File type: Script")
-            # Read shebang
-            with open(tool_path, 'r') as f:
-                shebang = f.readline().strip()
-                print(f"   Shebang: {shebang}")
-                
-                # Check if the interpreter exists
-                if shebang.startswith('#!'):
-                    interpreter = shebang[2:].split()[0]
-                    if not Path(interpreter).exists():
-                        print(f"❌ Interpreter not found: {interpreter}")
-                        return False
-                    else:
-                        print(f"✅ Interpreter found: {interpreter}")
-                        
-        elif first_bytes.startswith(b'\x7fELF'):
-            print(f"📄 File type: ELF executable (Linux)")
-        elif first_bytes.startswith(b'\xcf\xfa\xed\xfe') or first_bytes.startswith(b'\xca\xfe\xba\xbe'):
-            print(f"📄 File type: Mach-O executable (macOS)")
-        else:
-            print(f"📄 File type: Unknown or binary")
-            print(f"   First bytes: {first_bytes[:20].hex()}")
-            
-    except Exception as e:
-        print(f"❌ Could not read file: {e}")
+    if read_error is not None:
+        print(f"❌ Could not read file: {read_error}")
         return False
     
+    # Shebang line from the bytes already read ("#!/bin/sh" or "#! /bin/sh")
+    shebang = first_bytes.split(b'\n', 1)[0].decode('utf-8', errors='replace').strip() if first_bytes.startswith(b'#!') else None
+    
+    if shebang is not None:
+        print(f"📄 File type: Script")
+        print(f"   Shebang: {shebang}")
+        
+        # Check if the interpreter exists
+        interpreter = shebang[2:].split()[0] if shebang[2:].strip() else None
+        if interpreter is None or not Path(interpreter).exists():
+            print(f"❌ Interpreter not found: {interpreter or '(empty shebang)'}")
+            return False
+        else:
+            print(f"✅ Interpreter found: {interpreter}")
+                
+    elif first_bytes[:4] in _MAGICS:
+        print(f"📄 File type: {_MAGICS[first_bytes[:4]]}")
+    else:
+        print(f"📄 File type: Unknown or binary")
+        print(f"   First bytes: {first_bytes[:20].hex()}")
+    
     # 5. Check if it's a symlink
     if tool_path_obj.is_symlink():
         target = tool_path_obj.readlink()
@@ -104,13 +153,7 @@ def test_specific_tool(tool_path):
     
     try:
         print(f"Running: {tool_path} -help")
-        result = subprocess.run(
-            [str(tool_path), "-help"], 
-            capture_output=True, 
-            text=True, 
-            timeout=30,
-            cwd=str(tool_path_obj.parent)  # Run from tool's directory
-        )
+        result = probe.result() if probe is not None else _run_help(tool_path)
         
         print(f"Exit code: {result.returncode}")
         
@@ -162,6 +205,32 @@ def test_specific_tool(tool_path):
         return False
 
 
+def _scan(root, targets, recursive=True):
+    """Yield (name, path) for every file under root whose name is in targets, using os.scandir.
+    
+    Subdirectories are only searched if recursive is set and root itself
+    does not already contain every target.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        subdirs = []
+        hits = set()
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name in targets and entry.is_file():
+                    hits.add(entry.name)
+                    yield entry.name, entry.path
+        if recursive and not (directory == root and hits >= targets):
+            stack.extend(subdirs)
+
+
 def find_ncbi_tools():
     """Find all NCBI tools on the system."""
     print("🔍 SEARCHING FOR NCBI TOOLS")
@@ -170,8 +239,8 @@ def find_ncbi_tools():
     # Based on user's information
     search_locations = [
         "/users/llchsy/edirect",  # User mentioned this location
-        str(Path.home() / "edirect"),  # Standard location
-        str(Path.home() / "Downloads" / "SRA_LLM-main"),  # User mentioned this
+        str(_HOME / "edirect"),  # Standard location
+        str(_HOME / "Downloads" / "SRA_LLM-main"),  # User mentioned this
         "/usr/local/bin",
         "/opt/homebrew/bin",
         "./bin",
@@ -179,36 +248,33 @@ def find_ncbi_tools():
     ]
     
     tools_to_find = ["esearch", "efetch"]
-    found_tools = {}
+    found_tools = {tool: [] for tool in tools_to_find}
+    seen = set()
+    
+    # Walk each location once for all tools instead of one rglob per tool
+    for location in search_locations:
+        try:
+            for tool, tool_path in _scan(str(Path(location)), set(tools_to_find), location not in _FLAT_DIRS):
+                if tool_path not in seen:
+                    seen.add(tool_path)
+                    found_tools[tool].append(tool_path)
+        except Exception as e:
+            print(f"  ⚠️  Error searching {location}: {e}")
     
     for tool in tools_to_find:
-        found_tools[tool] = []
         print(f"\nSearching for {tool}...")
-        
-        for location in search_locations:
-            try:
-                location_path = Path(location)
-                if location_path.exists():
-                    # Direct check
-                    tool_path = location_path / tool
-                    if tool_path.exists():
-                        found_tools[tool].append(str(tool_path))
-                        print(f"  ✅ Found: {tool_path}")
-                    
-                    # Recursive search
-                    for found_file in location_path.rglob(tool):
-                        if str(found_file) not in found_tools[tool]:
-                            found_tools[tool].append(str(found_file))
-                            print(f"  ✅ Found: {found_file}")
-                            
-            except Exception as e:
-                print(f"  ⚠️  Error searching {location}: {e}")
+        for tool_path in found_tools[tool]:
+            print(f"  ✅ Found: {tool_path}")
     
     return found_tools
 
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Test NCBI tools execution with detailed error information.")
+    parser.add_argument("--verbose", action="store_true", help="Also print file permission strings")
+    args = parser.parse_args()
+    
     print("🧬 NCBI TOOLS EXECUTION TEST")
     print("="*50)
     print(f"Platform: {os.name}")
@@ -223,18 +289,25 @@ def main():
     working_tools = []
     failed_tools = []
     
-    for tool_name, tool_paths in found_tools.items():
-        if not tool_paths:
-            print(f"\n❌ No instances of {tool_name} found")
-            continue
-            
-        print(f"\n📋 Found {len(tool_paths)} instance(s) of {tool_name}")
+    # Start the -help run of every executable instance up front; results are
+    # still reported one tool at a time below
+    all_paths = [tool_path for tool_paths in found_tools.values() for tool_path in tool_paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(all_paths) or 1)) as executor:
+        probes = {tool_path: executor.submit(_run_help, tool_path)
+                  for tool_path in all_paths if os.access(tool_path, os.X_OK)}
         
-        for tool_path in tool_paths:
-            if test_specific_tool(tool_path):
-                working_tools.append(tool_path)
-            else:
-                failed_tools.append(tool_path)
+        for tool_name, tool_paths in found_tools.items():
+            if not tool_paths:
+                print(f"\n❌ No instances of {tool_name} found")
+                continue
+                
+            print(f"\n📋 Found {len(tool_paths)} instance(s) of {tool_name}")
+            
+            for tool_path in tool_paths:
+                if test_specific_tool(tool_path, probes.get(tool_path), args.verbose):
+                    working_tools.append(tool_path)
+                else:
+                    failed_tools.append(tool_path)
     
     # Summary
     print(f"\n" + "="*60)